@@ -0,0 +1,67 @@
+"""Compare memory of Pydantic documents and their compact representation
+
+python benchmarks/compact_memory.py --objects 1000 --properties 20
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from onedm import sdf
+from onedm.sdf.compact import compact_document
+
+UNITS = ["Cel", "%RH", "lx", "W", "V", "A"]
+
+
+def make_document(objects: int, properties: int) -> dict:
+    return {
+        "info": {"title": "Synthetic document"},
+        "sdfObject": {
+            f"Object{i}": {
+                "label": f"Object {i}",
+                "sdfProperty": {
+                    f"property{j}": {
+                        "label": f"Property {i}.{j}",
+                        "type": "integer" if j % 2 else "number",
+                        "unit": UNITS[j % len(UNITS)],
+                        "minimum": 0,
+                        "maximum": 100 * (j % 3 + 1),
+                        "writable": bool(j % 4),
+                    }
+                    for j in range(properties)
+                },
+            }
+            for i in range(objects)
+        },
+    }
+
+
+def measure(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    result = func(*args)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--properties", type=int, default=20)
+    args = parser.parse_args()
+
+    raw = make_document(args.objects, args.properties)
+    doc, pydantic_size = measure(sdf.Document.model_validate, raw)
+    _, compact_size = measure(compact_document, doc)
+
+    count = args.objects * args.properties
+    print(f"Properties: {count}")
+    print(f"Pydantic:   {pydantic_size / 1e6:8.2f} MB")
+    print(f"Compact:    {compact_size / 1e6:8.2f} MB")
+    print(f"Ratio:      {compact_size / pydantic_size:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Synthetic SDF documents for benchmarks
+
+python benchmarks/corpus.py corpus/ --documents 100 --objects 10
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+UNITS = ["Cel", "%RH", "lx", "W", "V", "A"]
+
+
+def namespace(index: int) -> str:
+    return f"https://example.com/corpus/{index}"
+
+
+def make_property(i: int, j: int) -> dict:
+    kind = j % 4
+    if kind == 0:
+        return {
+            "label": f"Property {i}.{j}",
+            "type": "integer",
+            "unit": UNITS[j % len(UNITS)],
+            "minimum": 0,
+            "maximum": 100 * (j % 3 + 1),
+        }
+    if kind == 1:
+        return {"label": f"Property {i}.{j}", "type": "number", "writable": False}
+    if kind == 2:
+        return {"label": f"Property {i}.{j}", "type": "string", "maxLength": 64}
+    return {
+        "label": f"Property {i}.{j}",
+        "type": "object",
+        "properties": {"on": {"type": "boolean"}, "level": {"type": "integer"}},
+        "required": ["on"],
+    }
+
+
+def make_document(
+    objects: int = 10, properties: int = 10, index: int = 0, version: str = "1.0"
+) -> dict:
+    """Create a document with objects and properties, without references"""
+    return {
+        "info": {"title": f"Synthetic document {index}", "version": version},
+        "namespace": {"corpus": namespace(index)},
+        "defaultNamespace": "corpus",
+        "sdfObject": {
+            f"Object{i}": {
+                "label": f"Object {i}",
+                "sdfProperty": {
+                    f"property{j}": make_property(i, j) for j in range(properties)
+                },
+            }
+            for i in range(objects)
+        },
+    }
+
+
+def make_deep_references(depth: int) -> dict:
+    """Create a document where each sdfData definition references the previous"""
+    data = {"Level0": {"type": "integer", "minimum": 0, "maximum": 100}}
+    for i in range(1, depth):
+        data[f"Level{i}"] = {"sdfRef": f"#/sdfData/Level{i - 1}", "label": f"{i}"}
+    return {
+        "sdfData": data,
+        "sdfProperty": {"deepest": {"sdfRef": f"#/sdfData/Level{depth - 1}"}},
+    }
+
+
+def make_wide_references(width: int, documents: int = 1) -> dict:
+    """Create a document with many properties referencing other documents
+
+    The referenced documents are created by make_document() with
+    index 0 to documents - 1.
+    """
+    return {
+        "namespace": {f"ns{i}": namespace(i) for i in range(documents)},
+        "sdfObject": {
+            "Wide": {
+                "sdfProperty": {
+                    f"property{j}": {
+                        "sdfRef": f"ns{j % documents}:#/sdfObject/Object0"
+                        f"/sdfProperty/property{j % 4}",
+                        "description": f"Reference {j}",
+                    }
+                    for j in range(width)
+                }
+            }
+        },
+    }
+
+
+def write_corpus(
+    directory: Path, documents: int, objects: int = 10, properties: int = 10
+) -> list[Path]:
+    """Write documents created by make_document() as .sdf.json files"""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(documents):
+        path = directory / f"document{index}.sdf.json"
+        with path.open("w") as fp:
+            json.dump(make_document(objects, properties, index), fp)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--objects", type=int, default=10)
+    parser.add_argument("--properties", type=int, default=10)
+    args = parser.parse_args()
+
+    paths = write_corpus(args.directory, args.documents, args.objects, args.properties)
+    print(f"Wrote {len(paths)} documents to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measure the time it takes to import onedm.sdf
+
+Each import is done in a fresh interpreter, with pydantic imported first so
+that only the time spent in onedm is measured.
+
+    python benchmarks/import_time.py --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CODE = """
+import time
+import pydantic
+start = time.perf_counter()
+import onedm.sdf
+print(time.perf_counter() - start)
+"""
+
+
+def measure(runs: int) -> list[float]:
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", CODE],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    times = measure(args.runs)
+    print(f"Median: {statistics.median(times) * 1000:6.1f} ms")
+    print(f"Min:    {min(times) * 1000:6.1f} ms")
+    print(f"Max:    {max(times) * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
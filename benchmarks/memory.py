@@ -0,0 +1,158 @@
+"""Measure memory used when loading documents
+
+Reports memory retained after each phase (populating the registry, parsing,
+resolving, and model validation) and the peak memory during it, followed by
+memory retained per definition kind. A definition includes everything nested
+in it, e.g. an sdfObject includes its sdfProperty definitions.
+
+Documents are either given as files and directories, which are also used as
+the registry for global references, or generated by corpus.py:
+
+    python benchmarks/memory.py models/ --output memory.json
+    python benchmarks/memory.py --width 1000 --documents 50
+"""
+
+import argparse
+import gc
+import json
+from pathlib import Path
+import tracemalloc
+from typing import Any, Callable
+
+import corpus
+from onedm import sdf
+from onedm.sdf import registry
+from onedm.sdf.definitions import PropertyAdapter
+from onedm.sdf.from_type import data_adapter
+from onedm.sdf.validate import find_files
+
+KINDS: dict[str, Callable[[dict], Any]] = {
+    "sdfThing": sdf.Thing.model_validate,
+    "sdfObject": sdf.Object.model_validate,
+    "sdfProperty": PropertyAdapter.validate_python,
+    "sdfAction": sdf.Action.model_validate,
+    "sdfEvent": sdf.Event.model_validate,
+    "sdfData": data_adapter.validate_python,
+}
+
+
+def measure(func: Callable, *args) -> tuple[Any, int, int]:
+    """Call a function and measure memory
+
+    :returns: The result, bytes retained after the call while the result is
+              kept, and peak bytes during the call
+    """
+    gc.collect()
+    start, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = func(*args)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    return result, current - start, peak - start
+
+
+def collect_definitions(definition: dict, found: dict[str, list[dict]]) -> None:
+    for kind in KINDS:
+        for child in definition.get(kind, {}).values():
+            found[kind].append(child)
+            collect_definitions(child, found)
+
+
+def load_sources(args: argparse.Namespace) -> tuple[list[bytes], list[bytes]]:
+    """Get documents to measure and documents for the registry"""
+    if args.paths:
+        sources = [path.read_bytes() for path in find_files(args.paths)]
+        return sources, sources
+    models = [
+        json.dumps(corpus.make_document(1, 4, index)).encode()
+        for index in range(args.documents)
+    ]
+    main_document = corpus.make_wide_references(args.width, args.documents)
+    return [json.dumps(main_document).encode()], models
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", help="Files, directories, or globs")
+    parser.add_argument("--width", type=int, default=500)
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    sources, models = load_sources(args)
+
+    # Build validators and other caches before measuring
+    warm_up = corpus.make_document(1, 4)
+    sdf.Document.model_validate(sdf.Resolver.from_document(warm_up).resolve(warm_up))
+    for validate in KINDS.values():
+        validate({})
+
+    tracemalloc.start()
+    phases: dict[str, dict[str, int]] = {}
+
+    def record(phase: str, func: Callable, *args) -> Any:
+        result, retained, peak = measure(func, *args)
+        totals = phases.setdefault(phase, {"retained": 0, "peak": 0})
+        totals["retained"] += retained
+        totals["peak"] = max(totals["peak"], peak)
+        return result
+
+    def populate() -> registry.InMemoryRegistry:
+        reg = registry.InMemoryRegistry()
+        for source in models:
+            reg.add_document(json.loads(source))
+        return reg
+
+    models_registry = record("registry", populate)
+
+    raw_documents = []
+    resolved_documents = []
+    documents = []
+    for source in sources:
+        raw = record("parse", json.loads, source)
+        resolver = sdf.Resolver(raw, models_registry)
+        resolved = record("resolve", resolver.resolve, raw)
+        documents.append(record("validate", sdf.Document.model_validate, resolved))
+        raw_documents.append(raw)
+        resolved_documents.append(resolved)
+
+    found: dict[str, list[dict]] = {kind: [] for kind in KINDS}
+    for resolved in resolved_documents:
+        collect_definitions(resolved, found)
+    kinds = {}
+    for kind, validate in KINDS.items():
+        if not found[kind]:
+            continue
+        _, retained, peak = measure(
+            lambda definitions, validate=validate: [validate(d) for d in definitions],
+            found[kind],
+        )
+        kinds[kind] = {
+            "count": len(found[kind]),
+            "retained": retained,
+            "peak": peak,
+            "average": retained // len(found[kind]),
+        }
+    tracemalloc.stop()
+
+    print(f"{'Phase':20} {'Retained':>12} {'Peak':>12}")
+    for phase, totals in phases.items():
+        print(
+            f"{phase:20} {totals['retained'] / 1e6:9.2f} MB"
+            f" {totals['peak'] / 1e6:9.2f} MB"
+        )
+    print()
+    print(f"{'Kind':20} {'Count':>8} {'Retained':>12} {'Average':>12}")
+    for kind, totals in kinds.items():
+        print(
+            f"{kind:20} {totals['count']:8} {totals['retained'] / 1e6:9.2f} MB"
+            f" {totals['average']:10} B"
+        )
+
+    if args.output:
+        with args.output.open("w") as fp:
+            json.dump({"phases": phases, "kinds": kinds}, fp, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Benchmarks of loading, resolving, and validating SDF documents
+
+All documents are generated by corpus.py, so no network access is needed.
+Results can be written as JSON and compared with a previous run:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --compare before.json
+    python benchmarks/suite.py --filter validate_input
+"""
+
+import argparse
+import datetime
+import enum
+import json
+import platform
+import statistics
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+import pydantic
+
+import corpus
+from onedm import sdf
+from onedm.sdf import from_type, registry
+
+# Benchmark setup functions by name, returning the function to measure
+BENCHMARKS: dict[str, Callable[[Path], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup: Callable[[Path], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@benchmark("loader_to_sdf")
+def loader_to_sdf(_: Path):
+    raw = json.dumps(corpus.make_document(objects=10, properties=20)).encode()
+
+    def run():
+        loader = sdf.SDFLoader()
+        loader.load_bytes(raw)
+        return loader.to_sdf()
+
+    return run
+
+
+@benchmark("loader_to_sdf_with_references")
+def loader_to_sdf_with_references(_: Path):
+    models = registry.InMemoryRegistry()
+    for index in range(10):
+        models.add_document(corpus.make_document(objects=1, properties=4, index=index))
+    raw = json.dumps(corpus.make_wide_references(200, documents=10)).encode()
+
+    def run():
+        loader = sdf.SDFLoader(models)
+        loader.load_bytes(raw)
+        return loader.to_sdf()
+
+    return run
+
+
+@benchmark("resolve_deep")
+def resolve_deep(_: Path):
+    document = corpus.make_deep_references(200)
+    return lambda: sdf.Resolver.from_document(document).resolve(document)
+
+
+@benchmark("resolve_wide")
+def resolve_wide(_: Path):
+    models = registry.InMemoryRegistry()
+    for index in range(10):
+        models.add_document(corpus.make_document(objects=1, properties=4, index=index))
+    document = corpus.make_wide_references(1000, documents=10)
+    return lambda: sdf.Resolver(document, models).resolve(document)
+
+
+@benchmark("file_registry_update")
+def file_registry_update(tmp: Path):
+    directory = tmp / "update"
+    corpus.write_corpus(directory, documents=200, objects=5, properties=5)
+    models = registry.FileBasedRegistry(directory)
+    return models.update
+
+
+@benchmark("file_registry_get_documents")
+def file_registry_get_documents(tmp: Path):
+    directory = tmp / "get_documents"
+    corpus.write_corpus(directory, documents=200, objects=5, properties=5)
+    models = registry.FileBasedRegistry(directory)
+    namespaces = [corpus.namespace(index) for index in range(0, 200, 10)]
+    return lambda: [list(models.get_documents(ns)) for ns in namespaces]
+
+
+VALIDATE_INPUT = {
+    "integer": (sdf.IntegerData(minimum=0, maximum=100), 42),
+    "integer_enum": (
+        sdf.IntegerData(choices={"ON": {"const": 1}, "OFF": {"const": 0}}),
+        1,
+    ),
+    "number": (sdf.NumberData(minimum=0, maximum=100), 42.5),
+    "unix_time": (sdf.NumberData(sdf_type="unix-time"), 1700000000),
+    "boolean": (sdf.BooleanData(), True),
+    "string": (sdf.StringData(max_length=64, pattern="^[a-z]+$"), "hello"),
+    "byte_string": (sdf.StringData(sdf_type="byte-string"), "aGVsbG8="),
+    "array": (sdf.ArrayData(items=sdf.IntegerData()), list(range(20))),
+    "object": (
+        sdf.ObjectData(
+            properties={"on": sdf.BooleanData(), "level": sdf.IntegerData()},
+            required=["on"],
+        ),
+        {"on": True, "level": 3},
+    ),
+}
+
+
+def _register_validate_input(name: str, definition: sdf.Data, value: Any):
+    @benchmark(f"validate_input_{name}")
+    def setup(_: Path):
+        return lambda: definition.validate_input(value)
+
+
+for _name, (_definition, _value) in VALIDATE_INPUT.items():
+    _register_validate_input(_name, _definition, _value)
+
+
+class Mode(enum.IntEnum):
+    OFF = 0
+    HEAT = 1
+    COOL = 2
+
+
+class Schedule(pydantic.BaseModel):
+    time: datetime.time
+    temperature: float = pydantic.Field(ge=5, le=30)
+
+
+class Thermostat(pydantic.BaseModel):
+    mode: Mode
+    target: float | None = None
+    schedule: list[Schedule] = []
+
+
+@benchmark("data_from_type")
+def data_from_type(_: Path):
+    return lambda: from_type.data_from_type(Thermostat, cache=False)
+
+
+@benchmark("data_from_type_cached")
+def data_from_type_cached(_: Path):
+    return lambda: from_type.data_from_type(Thermostat)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", help="Only run benchmarks containing this")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Compare with JSON results")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["benchmarks"]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, setup in BENCHMARKS.items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = result = measure(setup(Path(tmp)), args.repeat)
+            line = f"{name:40} {result['min'] * 1e6:12.1f} us"
+            if name in baseline:
+                line += f" {result['min'] / baseline[name]['min']:8.2f}x"
+            print(line)
+
+    if args.output:
+        with args.output.open("w") as fp:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "pydantic": pydantic.VERSION,
+                    "benchmarks": results,
+                },
+                fp,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@
 https://ietf-wg-asdf.github.io/SDF/sdf.html
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .data import (
     AnyData,
     ArrayData,
@@ -28,9 +31,37 @@ from .definitions import (
     Thing,
 )
 from .document import Document, Information
-from .loader import SDFLoader
-from .resolver import Resolver
-from .registry import Registry
+
+if TYPE_CHECKING:
+    from .loader import SDFLoader
+    from .registry import Registry
+    from .resolver import Resolver
+
+# Imported on first use to speed up import
+_LAZY_IMPORTS = {
+    "SDFLoader": "loader",
+    "Registry": "registry",
+    "Resolver": "resolver",
+}
+
+_LAZY_SUBMODULES = {
+    "cache",
+    "codegen",
+    "compact",
+    "diff",
+    "exceptions",
+    "from_type",
+    "index",
+    "ingest",
+    "lazy",
+    "loader",
+    "metrics",
+    "registry",
+    "resolver",
+    "state",
+    "tracing",
+    "validate",
+}
 
 __all__ = [
     "SDFLoader",
@@ -59,3 +90,12 @@ __all__ = [
     "Registry",
     "Resolver",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        return getattr(module, name)
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,144 @@
+"""Caching of resolved and validated documents"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+from typing import Iterable
+
+import pydantic
+
+from .document import Document
+from .registry import NamespaceURI, Registry
+
+# Increase when the cached format changes
+_CACHE_VERSION = "2"
+
+
+class DocumentCache:
+    """On-disk cache of resolved and validated documents
+
+    A document is cached under a key derived from the hash of the source
+    document and the hashes of all registry documents it dereferenced,
+    so any change to either will result in a cache miss. Cached documents
+    are pickled, which means that loading them skips both resolution and
+    validation.
+
+    Only use a cache directory that is trusted, as loading pickles can execute
+    arbitrary code.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        self._dir = Path(directory)
+
+    def get(
+        self, source: bytes | str | dict, registry: Registry, lazy: bool = False
+    ) -> Document | None:
+        """Get a cached document
+
+        :param source: The unresolved source document, raw or parsed
+        :param registry: The registry used for resolving
+        :param lazy: Get a document validated lazily, see
+                     Document.model_validate_lazy()
+        :returns: The document or None if not cached or outdated
+        """
+        source_hash = hash_source(source)
+        try:
+            with self._dependencies_path(source_hash).open("r") as fp:
+                dependencies = [tuple(dependency) for dependency in json.load(fp)]
+        except (OSError, ValueError):
+            return None
+
+        key = self._key(source_hash, dependencies, registry, lazy)
+        try:
+            with self._document_path(key).open("rb") as fp:
+                return pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Corrupt or incompatible entry, treat it as a cache miss
+            return None
+
+    def put(
+        self,
+        source: bytes | str | dict,
+        registry: Registry,
+        document: Document,
+        dependencies: Iterable[tuple[NamespaceURI, str]],
+        lazy: bool = False,
+    ) -> None:
+        """Store a document in the cache
+
+        Lazily validated documents are stored separately and keep definitions
+        not yet validated as they are.
+
+        :param source: The unresolved source document, raw or parsed
+        :param registry: The registry used for resolving
+        :param document: The resolved and validated document
+        :param dependencies: Global URIs dereferenced during resolution as
+                             (namespace, path) tuples, see Resolver.dereferenced
+        :param lazy: The document was validated lazily
+        """
+        source_hash = hash_source(source)
+        unique_dependencies = sorted(set(dependencies))
+        key = self._key(source_hash, unique_dependencies, registry, lazy)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(
+            self._document_path(key),
+            pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        _write_atomic(
+            self._dependencies_path(source_hash),
+            json.dumps(unique_dependencies).encode("utf-8"),
+        )
+
+    def clear(self) -> None:
+        """Remove all cached documents"""
+        if not self._dir.exists():
+            return
+        for path in self._dir.iterdir():
+            if path.suffix in (".pickle", ".deps"):
+                path.unlink()
+
+    def _key(
+        self,
+        source_hash: str,
+        dependencies: Iterable[tuple[NamespaceURI, str]],
+        registry: Registry,
+        lazy: bool,
+    ) -> str:
+        digest = hashlib.sha256()
+        digest.update(
+            f"{_CACHE_VERSION}:{pydantic.VERSION}:{lazy}:{source_hash}".encode()
+        )
+        for ns, path in dependencies:
+            digest.update(f"\n{ns}#{path}:".encode())
+            for fragment in registry.get_fragments(ns, path):
+                digest.update(hash_source(fragment.load_document()).encode())
+                break
+        return digest.hexdigest()
+
+    def _dependencies_path(self, source_hash: str) -> Path:
+        return self._dir / f"{source_hash}.deps"
+
+    def _document_path(self, key: str) -> Path:
+        return self._dir / f"{key}.pickle"
+
+
+def hash_source(source: bytes | str | dict) -> str:
+    """Get a content hash of a raw or parsed document
+
+    Parsed documents are hashed independently of key order.
+    """
+    if isinstance(source, dict):
+        source = json.dumps(source, sort_keys=True, separators=(",", ":"))
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    return hashlib.sha256(source).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,456 @@
+"""Generate Python source code from SDF documents
+
+Pydantic models are generated for sdfThing, sdfObject, and object sdfData
+definitions, IntEnums for integer sdfChoice definitions, and type aliases for
+other sdfData definitions. The generated module can be imported instead of
+loading and resolving the SDF document at run time.
+
+    python -m onedm.sdf.codegen model.sdf.json --models models/ -o model.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import keyword
+import re
+from typing import Any, Literal
+
+from . import data, definitions
+from .document import Document
+from .loader import SDFLoader
+from .registry import FileBasedRegistry, NullRegistry
+
+_HEADER = '''"""Generated by onedm.sdf.codegen, do not edit
+
+Source: {source}
+"""
+
+'''
+
+_STRING_FORMATS = {
+    "uuid": ("uuid", "UUID"),
+    "date-time": ("datetime", "datetime"),
+    "date": ("datetime", "date"),
+    "time": ("datetime", "time"),
+    "uri": ("pydantic", "AnyUrl"),
+}
+
+
+def generate_module(document: Document) -> str:
+    """Generate Python source code for a resolved document
+
+    :param document: A document without unresolved references
+    :returns: Source code of a Python module
+    """
+    generator = _ModuleGenerator()
+    for name, thing in document.things.items():
+        generator.add_thing(name, thing, f"#/sdfThing/{name}")
+    for name, obj in document.objects.items():
+        generator.add_object(name, obj, f"#/sdfObject/{name}")
+    for name, definition in document.data.items():
+        generator.add_data(name, definition)
+    source = document.info.title or "an SDF document"
+    return _HEADER.format(source=_escape_docstring(source)) + generator.render()
+
+
+class _ModuleGenerator:
+    def __init__(self) -> None:
+        self._imports: dict[str, set[str]] = {}
+        self._blocks: list[str] = []
+        self._names: set[str] = set()
+        # Class names by class body, to share classes for identical definitions
+        self._classes: dict[tuple[str, str], str] = {}
+
+    def render(self) -> str:
+        imports = [
+            f"from {module} import {', '.join(sorted(names))}"
+            for module, names in sorted(self._imports.items())
+        ]
+        return "\n".join(imports) + "\n\n\n" + "\n\n\n".join(self._blocks) + "\n"
+
+    def add_thing(
+        self,
+        name: str,
+        thing: definitions.Thing,
+        pointer: str,
+        required: frozenset[str] = frozenset(),
+    ) -> str:
+        """
+        :param pointer: JSON pointer of the definition in the document
+        :param required: Pointers listed in sdfRequired of enclosing definitions
+        """
+        required = required | _required_pointers(thing.sdf_required)
+        attributes: set[str] = set()
+        fields = [
+            self._field(
+                child,
+                self.add_thing(
+                    _class_name(name, child),
+                    definition,
+                    f"{pointer}/sdfThing/{child}",
+                    required,
+                ),
+                attributes,
+                required=f"{pointer}/sdfThing/{child}" in required,
+            )
+            for child, definition in thing.things.items()
+        ]
+        fields += [
+            self._field(
+                child,
+                self.add_object(
+                    _class_name(name, child),
+                    definition,
+                    f"{pointer}/sdfObject/{child}",
+                    required,
+                ),
+                attributes,
+                required=f"{pointer}/sdfObject/{child}" in required,
+            )
+            for child, definition in thing.objects.items()
+        ]
+        fields += self._property_fields(
+            name,
+            thing.properties,
+            _required_names(f"{pointer}/sdfProperty/", required),
+            attributes,
+        )
+        return self._add_class(name, thing, fields)
+
+    def add_object(
+        self,
+        name: str,
+        obj: definitions.Object,
+        pointer: str,
+        required: frozenset[str] = frozenset(),
+    ) -> str:
+        """
+        :param pointer: JSON pointer of the definition in the document
+        :param required: Pointers listed in sdfRequired of enclosing definitions
+        """
+        required = required | _required_pointers(obj.sdf_required)
+        fields = self._property_fields(
+            name,
+            obj.properties,
+            _required_names(f"{pointer}/sdfProperty/", required),
+            set(),
+        )
+        return self._add_class(name, obj, fields)
+
+    def add_data(self, name: str, definition: data.Data) -> str:
+        type_ = self._type(definition, name)
+        base = type_.removesuffix(" | None")
+        if base in self._classes.values():
+            # A class was generated for the definition
+            return base
+        alias = self._unique_name(name)
+        self._blocks.append(f"{alias} = {type_}")
+        return alias
+
+    def _property_fields(
+        self,
+        parent: str,
+        properties: dict[str, definitions.Property],
+        required: set[str],
+        attributes: set[str],
+    ) -> list[str]:
+        return [
+            self._field(
+                name,
+                self._type(definition, _class_name(parent, name)),
+                attributes,
+                required=bool(definition.sdf_required) or name in required,
+                default=definition.default,
+                description=definition.description,
+            )
+            for name, definition in properties.items()
+        ]
+
+    # pylint: disable-next=too-many-arguments
+    def _field(
+        self,
+        name: str,
+        type_: str,
+        attributes: set[str],
+        *,
+        required: bool = True,
+        default: Any = None,
+        description: str | None = None,
+    ) -> str:
+        """
+        :param attributes: Attribute names already used in the class, the
+                           name of this field is added
+        """
+        attribute = base = _attribute_name(name)
+        counter = 2
+        while attribute in attributes:
+            attribute = f"{base}_{counter}"
+            counter += 1
+        attributes.add(attribute)
+        kwargs = {}
+        if not required:
+            kwargs["default"] = repr(default)
+            if default is None and type_ != "None" and not type_.endswith("| None"):
+                type_ += " | None"
+        if attribute != name:
+            kwargs["alias"] = repr(name)
+        if description:
+            kwargs["description"] = repr(description)
+
+        if not kwargs:
+            return f"    {attribute}: {type_}"
+        if list(kwargs) == ["default"]:
+            return f"    {attribute}: {type_} = {kwargs['default']}"
+        self._import("pydantic", "Field")
+        arguments = ", ".join(f"{key}={value}" for key, value in kwargs.items())
+        return f"    {attribute}: {type_} = Field({arguments})"
+
+    def _add_class(self, name: str, definition: Any, fields: list[str]) -> str:
+        self._import("pydantic", "BaseModel", "ConfigDict")
+        lines = []
+        if definition.description or definition.label:
+            lines.append(
+                f"    {_docstring(definition.description or definition.label)}"
+            )
+            lines.append("")
+        lines.append("    model_config = ConfigDict(populate_by_name=True)")
+        if fields:
+            lines.append("")
+            lines.extend(fields)
+        return self._add_class_source(name, "BaseModel", "\n".join(lines))
+
+    def _add_class_source(self, name: str, base: str, body: str) -> str:
+        # Reuse an existing class with identical source
+        key = (base, body)
+        if key in self._classes:
+            return self._classes[key]
+        class_name = self._unique_name(name)
+        self._classes[key] = class_name
+        self._blocks.append(f"class {class_name}({base}):\n{body}")
+        return class_name
+
+    def _unique_name(self, name: str) -> str:
+        name = _identifier(name[:1].upper() + name[1:])
+        unique = name
+        counter = 2
+        while unique in self._names:
+            unique = f"{name}{counter}"
+            counter += 1
+        self._names.add(unique)
+        return unique
+
+    def _import(self, module: str, *names: str) -> None:
+        self._imports.setdefault(module, set()).update(names)
+
+    # pylint: disable-next=too-many-return-statements,too-many-branches
+    def _type(
+        self, definition: data.DataQualities, name: str, nullable: bool = True
+    ) -> str:
+        if definition.const is None and "const" in definition.model_fields_set:
+            return "None"
+
+        type_: str
+        if definition.const is not None:
+            self._import("typing", "Literal")
+            type_ = f"Literal[{definition.const!r}]"
+        elif isinstance(definition, data.IntegerData) and definition.choices:
+            type_ = self._enum(definition, name)
+        elif definition.choices:
+            choices = [
+                self._type(choice, _class_name(name, choice_name), nullable=False)
+                for choice_name, choice in definition.choices.items()
+            ]
+            type_ = " | ".join(dict.fromkeys(choices))
+        elif isinstance(definition, data.IntegerData):
+            type_ = self._constrained(
+                "int",
+                ge=definition.minimum,
+                le=definition.maximum,
+                gt=definition.exclusive_minimum,
+                lt=definition.exclusive_maximum,
+                multiple_of=definition.multiple_of,
+            )
+        elif isinstance(definition, data.NumberData):
+            if definition.sdf_type == "unix-time":
+                self._import("datetime", "datetime")
+                type_ = "datetime"
+            else:
+                type_ = self._constrained(
+                    "float",
+                    ge=definition.minimum,
+                    le=definition.maximum,
+                    gt=definition.exclusive_minimum,
+                    lt=definition.exclusive_maximum,
+                    multiple_of=definition.multiple_of,
+                )
+        elif isinstance(definition, data.BooleanData):
+            type_ = "bool"
+        elif isinstance(definition, data.StringData):
+            type_ = self._string(definition)
+        elif isinstance(definition, data.ArrayData):
+            item = (
+                self._type(definition.items, _class_name(name, "item"))
+                if definition.items is not None
+                else "Any"
+            )
+            if item == "Any":
+                self._import("typing", "Any")
+            type_ = self._constrained(
+                f"{'set' if definition.unique_items else 'list'}[{item}]",
+                min_length=definition.min_items or None,
+                max_length=definition.max_items,
+            )
+        elif isinstance(definition, data.ObjectData):
+            type_ = self._object(definition, name)
+        else:
+            self._import("typing", "Any")
+            return "Any"
+
+        if nullable and definition.nullable and type_ != "None":
+            type_ += " | None"
+        return type_
+
+    def _string(self, definition: data.StringData) -> str:
+        if definition.enum is not None:
+            self._import("typing", "Literal")
+            return f"Literal[{', '.join(map(repr, definition.enum))}]"
+        if definition.sdf_type == "byte-string" or definition.format == "bytes":
+            base = "bytes"
+        elif definition.format in _STRING_FORMATS:
+            module, base = _STRING_FORMATS[definition.format]
+            self._import(module, base)
+            return base
+        else:
+            base = "str"
+        pattern = definition.pattern
+        return self._constrained(
+            base,
+            min_length=definition.min_length or None,
+            max_length=definition.max_length,
+            pattern=(
+                pattern
+                if isinstance(pattern, str) or pattern is None
+                else pattern.pattern
+            ),
+        )
+
+    def _enum(self, definition: data.IntegerData, name: str) -> str:
+        assert definition.choices is not None
+        members = [
+            f"    {_identifier(choice_name)} = {choice.const!r}"
+            for choice_name, choice in definition.choices.items()
+            if choice.const is not None
+        ]
+        self._import("enum", "IntEnum")
+        lines = []
+        if definition.description:
+            lines.append(f"    {_docstring(definition.description)}")
+            lines.append("")
+        lines.extend(members or ["    pass"])
+        return self._add_class_source(name, "IntEnum", "\n".join(lines))
+
+    def _object(self, definition: data.ObjectData, name: str) -> str:
+        if definition.properties is None:
+            self._import("typing", "Any")
+            return "dict[str, Any]"
+        attributes: set[str] = set()
+        fields = [
+            self._field(
+                property_name,
+                self._type(property_, _class_name(name, property_name)),
+                attributes,
+                required=property_name in definition.required,
+                default=property_.default,
+                description=property_.description,
+            )
+            for property_name, property_ in definition.properties.items()
+        ]
+        return self._add_class(name, definition, fields)
+
+    def _constrained(self, base: str, **constraints: Any) -> str:
+        arguments = ", ".join(
+            f"{key}={value!r}"
+            for key, value in constraints.items()
+            if value is not None
+        )
+        if not arguments:
+            return base
+        self._import("typing", "Annotated")
+        self._import("pydantic", "Field")
+        return f"Annotated[{base}, Field({arguments})]"
+
+
+def _class_name(parent: str, child: str) -> str:
+    return parent + "".join(
+        part[:1].upper() + part[1:] for part in re.split(r"[^0-9A-Za-z]+", child)
+    )
+
+
+def _identifier(name: str) -> str:
+    name = re.sub(r"\W", "_", name)
+    if not name or name[0].isdigit():
+        name = "_" + name
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def _attribute_name(name: str) -> str:
+    # Convert camelCase to snake_case
+    snake = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+    attribute = _identifier(snake)
+    if attribute.startswith("_"):
+        # Pydantic treats these as private attributes
+        attribute = "field" + attribute
+    return attribute
+
+
+def _required_pointers(required: list[str | Literal[True]]) -> frozenset[str]:
+    # Pointers may be qualified with the namespace of the document
+    return frozenset(
+        "#" + pointer.partition("#")[2]
+        for pointer in required
+        if isinstance(pointer, str) and "#" in pointer
+    )
+
+
+def _required_names(prefix: str, required: frozenset[str]) -> set[str]:
+    # Names of children with pointers starting with the prefix
+    names = set()
+    for pointer in required:
+        if pointer.startswith(prefix):
+            name = pointer.removeprefix(prefix)
+            if "/" not in name:
+                names.add(name)
+    return names
+
+
+def _escape_docstring(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def _docstring(text: str) -> str:
+    return '"""' + _escape_docstring(text) + '"""'
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate Python models from SDF")
+    parser.add_argument("filename")
+    parser.add_argument("--models", help="Directory with global models")
+    parser.add_argument("-o", "--output", help="Output file, default is stdout")
+    args = parser.parse_args(argv)
+
+    loader = SDFLoader(
+        FileBasedRegistry(args.models) if args.models else NullRegistry()
+    )
+    loader.load_file(args.filename)
+    source = generate_module(loader.to_sdf())
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(source)
+    else:
+        print(source, end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ class CommonQualities(BaseModel):
         populate_by_name=True,  # Deprecated
         validate_by_name=True,
         validate_by_alias=True,
+        # Build schemas on first use to speed up import
+        defer_build=True,
     )
 
     label: str | None = None
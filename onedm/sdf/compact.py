@@ -0,0 +1,221 @@
+"""Compact read-only representation of resolved documents
+
+Suitable for keeping a large number of definitions in memory. Only qualities
+that were explicitly set are stored, strings are interned, and identical
+definitions are shared.
+
+Example:
+
+    compact = compact_document(doc)
+    compact.objects["Switch"].properties["state"].writable
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import sys
+from typing import Any
+
+from pydantic import BaseModel
+
+from .document import Document
+
+
+class CompactDefinition:
+    """Read-only definition storing only explicitly set qualities
+
+    Qualities are accessed as attributes, just like on the Pydantic model it
+    was created from. Qualities that were not set return the model's default.
+    """
+
+    __slots__ = ("_cls", "_names", "_values", "_hash")
+
+    _cls: type[BaseModel]
+    _names: tuple[str, ...]
+    _values: tuple[Any, ...]
+    _hash: int | None
+
+    def __init__(
+        self, cls: type[BaseModel], names: tuple[str, ...], values: tuple[Any, ...]
+    ) -> None:
+        object.__setattr__(self, "_cls", cls)
+        object.__setattr__(self, "_names", names)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_hash", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[self._names.index(name)]
+        except ValueError:
+            pass
+        field = self._cls.model_fields.get(name)
+        if field is None:
+            raise AttributeError(f"{self._cls.__name__} has no quality {name}")
+        default = field.get_default(call_default_factory=True)
+        if isinstance(default, dict):
+            return EMPTY_MAP
+        if isinstance(default, list):
+            return ()
+        return default
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactDefinition):
+            return NotImplemented
+        return (
+            self._cls is other._cls
+            and self._names == other._names
+            and tuple(map(_strict, self._values)) == tuple(map(_strict, other._values))
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(
+                self,
+                "_hash",
+                hash((self._cls, self._names, tuple(map(_strict, self._values)))),
+            )
+        return self._hash  # type: ignore[return-value]
+
+    def __reduce__(self):
+        return (CompactDefinition, (self._cls, self._names, self._values))
+
+    def __repr__(self) -> str:
+        qualities = ", ".join(
+            f"{name}={value!r}" for name, value in zip(self._names, self._values)
+        )
+        return f"Compact{self._cls.__name__}({qualities})"
+
+    @property
+    def model_class(self) -> type[BaseModel]:
+        """The Pydantic model class this definition was created from"""
+        return self._cls
+
+    def qualities(self) -> dict[str, Any]:
+        """Get the explicitly set qualities"""
+        return dict(zip(self._names, self._values))
+
+
+class FrozenMap(Mapping[str, Any]):
+    """Read-only and hashable mapping"""
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+        self._hash: int | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenMap):
+            return len(self) == len(other) and all(
+                key in other._data and _strict(value) == _strict(other._data[key])
+                for key, value in self._data.items()
+            )
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(
+                frozenset((key, _strict(value)) for key, value in self._data.items())
+            )
+        return self._hash
+
+    def __reduce__(self):
+        return (FrozenMap, (self._data,))
+
+    def __repr__(self) -> str:
+        return f"FrozenMap({self._data!r})"
+
+
+EMPTY_MAP = FrozenMap({})
+
+
+class CompactBuilder:  # pylint: disable=too-few-public-methods
+    """Creates compact definitions
+
+    Identical definitions, mappings, and quality name combinations created by
+    the same builder are shared.
+    """
+
+    def __init__(self) -> None:
+        self._pool: dict[Any, Any] = {}
+
+    def compact(self, model: BaseModel) -> CompactDefinition:
+        """Create a compact definition from a Pydantic model"""
+        qualities: dict[str, Any] = {
+            name: getattr(model, name) for name in sorted(model.model_fields_set)
+        }
+        if model.model_extra:
+            qualities.update(model.model_extra)
+        names = self._share(tuple(sys.intern(name) for name in qualities))
+        values = tuple(self._freeze(value) for value in qualities.values())
+        return self._share(CompactDefinition(type(model), names, values))
+
+    def _freeze(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return self.compact(value)
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, dict):
+            if not value:
+                return EMPTY_MAP
+            return self._share(
+                FrozenMap(
+                    {
+                        sys.intern(key) if isinstance(key, str) else key: (
+                            self._freeze(item)
+                        )
+                        for key, item in value.items()
+                    }
+                )
+            )
+        if isinstance(value, (list, tuple)):
+            return self._share(tuple(self._freeze(item) for item in value))
+        if isinstance(value, set):
+            return frozenset(self._freeze(item) for item in value)
+        return value
+
+    def _share(self, value: Any) -> Any:
+        try:
+            key = (type(value), _strict(value))
+            return self._pool.setdefault(key, value)
+        except TypeError:
+            # Not hashable
+            return value
+
+
+def compact_document(
+    document: Document, builder: CompactBuilder | None = None
+) -> CompactDefinition:
+    """Create a compact read-only representation of a resolved document
+
+    :param document: The document to convert
+    :param builder: Use the same builder for multiple documents to share
+                    identical definitions between them
+    """
+    return (builder or CompactBuilder()).compact(document)
+
+
+def _strict(value: Any) -> Any:
+    # Make e.g. True, 1 and 1.0 compare and hash differently
+    if isinstance(value, (bool, int, float)):
+        return (type(value), value)
+    if isinstance(value, tuple):
+        return tuple(map(_strict, value))
+    return value
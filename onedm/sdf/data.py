@@ -10,11 +10,12 @@ import datetime
 from abc import ABC
 from enum import EnumMeta, IntEnum
 from re import Pattern
-from typing import Annotated, Any, Literal, Union
+from typing import Annotated, Any, Callable, Literal, Union
 
-from pydantic import Field, NonNegativeInt, model_serializer
-from pydantic_core import SchemaValidator, core_schema
+from pydantic import Field, NonNegativeInt, ValidationError, model_serializer
+from pydantic_core import InitErrorDetails, SchemaValidator, core_schema
 
+from . import tracing
 from .common import CommonQualities
 
 
@@ -67,9 +68,19 @@ class DataQualities(CommonQualities, ABC):
             schema = core_schema.nullable_schema(schema)
         return schema
 
+    def get_validator(self) -> Callable[[Any], Any]:
+        """Build a function validating and coercing values like validate_input.
+
+        Building the validator is the expensive part of validate_input, so
+        keep it when validating many values. It will not reflect later changes
+        to the definition.
+        """
+        return SchemaValidator(self.get_pydantic_schema()).validate_python
+
     def validate_input(self, value: Any) -> Any:
         """Validate and coerce a value."""
-        return SchemaValidator(self.get_pydantic_schema()).validate_python(value)
+        with tracing.span("sdf.validate_value", type=self.type, definition=self):
+            return self.get_validator()(value)
 
 
 class NumberData(DataQualities):
@@ -157,16 +168,22 @@ class IntegerData(DataQualities):
             )
         return self._enum
 
-    def validate_input(self, value: Any) -> IntEnum | int:
-        value = super().validate_input(value)
-        # Convert to enum.IntEnum if possible
-        if enum_cls := self.to_enum():
+    def get_validator(self) -> Callable[[Any], IntEnum | int]:
+        validate = super().get_validator()
+        enum_cls = self.to_enum()
+        if enum_cls is None:
+            return validate
+
+        def validate_enum(value: Any) -> IntEnum | int:
+            value = validate(value)
+            # Convert to enum.IntEnum if possible
             try:
                 return enum_cls(value)
             except ValueError:
                 # Value is valid but not a specific enum value
-                pass
-        return value
+                return value
+
+        return validate_enum
 
 
 class BooleanData(DataQualities):
@@ -261,6 +278,130 @@ class ObjectData(DataQualities):
             }
         )
 
+    def validate_patch(
+        self, current: dict[str, Any], patch: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Apply a JSON merge patch to a valid value and validate the changes.
+
+        Only members in the patch are validated, and required members are
+        only checked when removed, so the cost depends on the size of the
+        patch rather than the object. Nested objects are patched the same way.
+        Objects with const or sdfChoice are validated as a whole after
+        applying the patch.
+
+        :param current: A valid value, which is not modified
+        :param patch: Members to add or replace, or None to remove them
+        :returns: The patched value
+        :raises pydantic.ValidationError: With locations relative to this object
+        """
+        return self.get_patch_validator()(current, patch)
+
+    def get_patch_validator(
+        self,
+    ) -> Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]:
+        """Build a function applying merge patches like validate_patch.
+
+        Validators for members are built when first patched and kept, so keep
+        the function when patching many values. It will not reflect later
+        changes to the definition.
+        """
+        validators: dict[str, Callable[[Any], Any]] = {}
+        patch_validators: dict[
+            str, Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]
+        ] = {}
+
+        def validate_member(
+            name: str, definition: DataQualities, current: Any, value: Any
+        ) -> Any:
+            if (
+                isinstance(definition, ObjectData)
+                and isinstance(value, dict)
+                and isinstance(current, dict)
+            ):
+                if definition.const is None and definition.choices is None:
+                    if name not in patch_validators:
+                        patch_validators[name] = definition.get_patch_validator()
+                    return patch_validators[name](current, value)
+                value = _merge_patch(current, value)
+            if name not in validators:
+                validators[name] = definition.get_validator()
+            with tracing.span(
+                "sdf.validate_value", type=definition.type, definition=definition
+            ):
+                return validators[name](_remove_nulls(value))
+
+        def validate_patch(
+            current: dict[str, Any], patch: dict[str, Any]
+        ) -> dict[str, Any]:
+            if self.const is not None or self.choices is not None:
+                # Constraints on the whole object
+                if "" not in validators:
+                    validators[""] = self.get_validator()
+                with tracing.span(
+                    "sdf.validate_value", type=self.type, definition=self
+                ):
+                    return validators[""](_merge_patch(current, patch))
+            patched = dict(current)
+            errors: list[InitErrorDetails] = []
+            for name, value in patch.items():
+                if value is None:
+                    if name in self.required:
+                        errors.append(
+                            {"type": "missing", "loc": (name,), "input": patch}
+                        )
+                    patched.pop(name, None)
+                    continue
+                if self.properties is None:
+                    patched[name] = _remove_nulls(value)
+                    continue
+                definition = self.properties.get(name)
+                if definition is None:
+                    # Unknown members are ignored, like when validating the object
+                    continue
+                try:
+                    patched[name] = validate_member(
+                        name, definition, current.get(name), value
+                    )
+                except ValidationError as exc:
+                    for error in exc.errors(include_url=False):
+                        details: InitErrorDetails = {
+                            "type": error["type"],
+                            "loc": (name, *error["loc"]),
+                            "input": error["input"],
+                        }
+                        if "ctx" in error:
+                            details["ctx"] = error["ctx"]
+                        errors.append(details)
+            if errors:
+                raise ValidationError.from_exception_data(type(self).__name__, errors)
+            return patched
+
+        return validate_patch
+
+
+def _merge_patch(target: Any, patch: Any) -> Any:
+    # Apply a JSON merge patch (RFC 7386) without validation
+    if not isinstance(patch, dict):
+        return patch
+    merged = dict(target) if isinstance(target, dict) else {}
+    for name, value in patch.items():
+        if value is None:
+            merged.pop(name, None)
+        else:
+            merged[name] = _merge_patch(merged.get(name), value)
+    return merged
+
+
+def _remove_nulls(value: Any) -> Any:
+    # Null members in a merge patch mean removal, also when adding new objects
+    if isinstance(value, dict):
+        return {
+            name: _remove_nulls(member)
+            for name, member in value.items()
+            if member is not None
+        }
+    return value
+
 
 class AnyData(DataQualities):
     type: Literal[None] = None
@@ -276,9 +417,3 @@ Data = Union[
         Field(discriminator="type"),
     ],
 ]
-
-
-ObjectData.model_rebuild()
-ArrayData.model_rebuild()
-DataQualities.model_rebuild()
-AnyData.model_rebuild()
@@ -2,8 +2,16 @@ from __future__ import annotations
 
 from typing import Annotated, Literal, Tuple, Union
 
-from pydantic import Field, NonNegativeInt, TypeAdapter
+from pydantic import (
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    TypeAdapter,
+    field_validator,
+    model_serializer,
+)
 
+from . import lazy
 from .common import CommonQualities
 from .data import (
     AnyData,
@@ -67,7 +75,9 @@ Property = Union[
 
 
 # pylint: disable-next=invalid-name
-PropertyAdapter: TypeAdapter[Property] = TypeAdapter(Property)
+PropertyAdapter: TypeAdapter[Property] = TypeAdapter(
+    Property, config=ConfigDict(defer_build=True)
+)
 
 
 def property_from_data(data: Data) -> Property:
@@ -119,6 +129,11 @@ class Object(CommonQualities):
     min_items: NonNegativeInt | None = None
     max_items: NonNegativeInt | None = None
 
+    _validate_lazily = field_validator(
+        "properties", "actions", "events", "data", "context", mode="wrap"
+    )(lazy.validate_lazily)
+    _serialize_materialized = model_serializer(mode="wrap")(lazy.serialize_materialized)
+
 
 class Thing(CommonQualities):
     things: dict[str, Thing] = Field(
@@ -164,5 +179,14 @@ class Thing(CommonQualities):
     min_items: NonNegativeInt | None = None
     max_items: NonNegativeInt | None = None
 
-
-Thing.model_rebuild()
+    _validate_lazily = field_validator(
+        "things",
+        "objects",
+        "properties",
+        "actions",
+        "events",
+        "data",
+        "context",
+        mode="wrap",
+    )(lazy.validate_lazily)
+    _serialize_materialized = model_serializer(mode="wrap")(lazy.serialize_materialized)
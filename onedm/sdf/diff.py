@@ -0,0 +1,127 @@
+"""Structural hashing and comparison of documents
+
+Every object in a document is hashed from the hashes of its members, like a
+Merkle tree, so identical subtrees can be skipped when comparing documents.
+Hashes do not depend on key order.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from .registry import DEFINITION_GROUPS, NamespaceURI, Registry
+
+
+class HashNode(NamedTuple):
+    """Structural hash of a JSON value"""
+
+    digest: bytes
+    """Hash of the value including all its members"""
+    children: dict[str, HashNode] | None
+    """Hashes of the members if the value is an object"""
+
+
+@dataclass
+class DocumentDiff:
+    """Differences between two documents as JSON pointers"""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def definitions(self) -> list[str]:
+        """Get the named definitions affected by any difference
+
+        For example a change to "#/sdfObject/A/sdfProperty/b/maximum" affects
+        "#/sdfObject/A/sdfProperty/b". Differences outside named definitions
+        are reported by their top-level quality, e.g. "#/info".
+        """
+        affected = set()
+        for pointer in self.added + self.removed + self.changed:
+            segments = pointer.split("/")
+            end = min(len(segments), 2)
+            for i in range(1, len(segments) - 1):
+                if segments[i] in DEFINITION_GROUPS:
+                    end = i + 2
+            affected.add("/".join(segments[:end]))
+        return sorted(affected)
+
+
+def hash_tree(value: Any) -> HashNode:
+    """Compute structural hashes of a document or definition
+
+    :param value: A raw definition or a Pydantic model, which will be hashed
+                  as if dumped with exclude_unset=True and by_alias=True
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", exclude_unset=True, by_alias=True)
+    return _hash_value(value)
+
+
+def diff(old: Any, new: Any) -> DocumentDiff:
+    """Compare two documents or definitions
+
+    :param old: Raw definition, Pydantic model, or result from hash_tree()
+    :param new: Raw definition, Pydantic model, or result from hash_tree()
+    """
+    result = DocumentDiff()
+    _diff_nodes(_as_tree(old), _as_tree(new), "#", result)
+    return result
+
+
+def diff_versions(
+    registry: Registry, ns: NamespaceURI, old_version: str, new_version: str
+) -> DocumentDiff:
+    """Compare two versions of a document in a registry"""
+    return diff(
+        registry.get_document(ns, old_version), registry.get_document(ns, new_version)
+    )
+
+
+def _as_tree(value: Any) -> HashNode:
+    if isinstance(value, HashNode):
+        return value
+    return hash_tree(value)
+
+
+def _hash_value(value: Any) -> HashNode:
+    if isinstance(value, dict):
+        children = {key: _hash_value(child) for key, child in value.items()}
+        digest = hashlib.blake2b(b"object", digest_size=16)
+        for key in sorted(children):
+            digest.update(json.dumps(key).encode("utf-8"))
+            digest.update(children[key].digest)
+        return HashNode(digest.digest(), children)
+    if isinstance(value, (list, tuple)):
+        digest = hashlib.blake2b(b"array", digest_size=16)
+        for item in value:
+            digest.update(_hash_value(item).digest)
+        return HashNode(digest.digest(), None)
+    scalar = json.dumps(value).encode("utf-8")
+    return HashNode(hashlib.blake2b(scalar, digest_size=16).digest(), None)
+
+
+def _diff_nodes(old: HashNode, new: HashNode, path: str, result: DocumentDiff) -> None:
+    if old.digest == new.digest:
+        # Identical subtrees
+        return
+    if old.children is None or new.children is None:
+        result.changed.append(path)
+        return
+    for key, old_child in old.children.items():
+        new_child = new.children.get(key)
+        if new_child is None:
+            result.removed.append(f"{path}/{key}")
+        else:
+            _diff_nodes(old_child, new_child, f"{path}/{key}", result)
+    for key in new.children:
+        if key not in old.children:
+            result.added.append(f"{path}/{key}")
@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Annotated
+from functools import cached_property
+from typing import Annotated, Any, Iterator, TextIO
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer
 from pydantic.alias_generators import to_camel
+from pydantic_core import to_json
 
-from . import definitions
+from . import definitions, lazy
+from .index import DocumentIndex
 
 
 class Information(BaseModel):
@@ -14,6 +19,8 @@ class Information(BaseModel):
     and all included definitions.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     title: Annotated[
         str | None,
         Field(description="A short summary to be displayed in search results, etc."),
@@ -47,7 +54,7 @@ class Information(BaseModel):
 
 class Document(BaseModel):
     model_config = ConfigDict(
-        extra="allow", alias_generator=to_camel, populate_by_name=True
+        extra="allow", alias_generator=to_camel, populate_by_name=True, defer_build=True
     )
 
     info: Information = Field(default_factory=Information)
@@ -101,5 +108,103 @@ class Document(BaseModel):
         ),
     )
 
+    _validate_lazily = field_validator(
+        "things", "objects", "properties", "actions", "events", "data", mode="wrap"
+    )(lazy.validate_lazily)
+    _serialize_materialized = model_serializer(mode="wrap")(lazy.serialize_materialized)
+
+    @classmethod
+    def model_validate_lazy(cls, obj: dict) -> Document:
+        """Validate a document lazily
+
+        The definitions in sdfThing, sdfObject, sdfProperty, sdfAction,
+        sdfEvent, sdfData, and sdfContext of the document and all things and
+        objects are validated on first access instead.
+        """
+        return cls.model_validate(obj, context=lazy.LAZY_CONTEXT)
+
+    @cached_property
+    def index(self) -> DocumentIndex:
+        """Index of all named definitions for fast queries
+
+        Built on first access. Use "del document.index" to have it rebuilt
+        after the document has been changed.
+        """
+        return DocumentIndex(self)
+
     def to_json(self) -> str:
         return self.model_dump_json(indent=2, exclude_unset=True, by_alias=True)
+
+    def iter_json(self, indent: int | None = 2) -> Iterator[str]:
+        """Serialize to JSON in chunks
+
+        Produces the same output as to_json() but only one definition at a
+        time is serialized, so the complete JSON string is never held in
+        memory.
+
+        :param indent: Number of spaces to indent with, or None for compact
+                       output
+        """
+        newline = "\n" if indent is not None else ""
+        pad = " " * (indent or 0)
+        colon = ": " if indent is not None else ":"
+
+        yield "{"
+        separator = newline
+        for name, value in self._iter_set_fields():
+            yield f"{separator}{pad}{_encode(name)}{colon}"
+            separator = "," + newline
+            if name in _SECTIONS:
+                yield from _iter_section_json(value, indent)
+            else:
+                yield _indent(_dump_json(value, indent), pad)
+        yield newline + "}" if separator != newline else "}"
+
+    def write_json(self, fp: TextIO, indent: int | None = 2) -> None:
+        """Serialize to JSON and write to a file object in chunks
+
+        See iter_json().
+        """
+        for chunk in self.iter_json(indent):
+            fp.write(chunk)
+
+    def _iter_set_fields(self) -> Iterator[tuple[str, Any]]:
+        # Same order as model_dump_json(exclude_unset=True, by_alias=True)
+        for name, field in type(self).model_fields.items():
+            if name in self.model_fields_set:
+                yield field.alias or name, getattr(self, name)
+        if self.model_extra:
+            yield from self.model_extra.items()
+
+
+_SECTIONS = {"sdfThing", "sdfObject", "sdfProperty", "sdfAction", "sdfEvent", "sdfData"}
+
+
+def _iter_section_json(section: dict, indent: int | None) -> Iterator[str]:
+    if not section:
+        yield "{}"
+        return
+    newline = "\n" if indent is not None else ""
+    pad = " " * (indent or 0) * 2
+    colon = ": " if indent is not None else ":"
+
+    separator = "{" + newline
+    for name, definition in section.items():
+        yield f"{separator}{pad}{_encode(name)}{colon}"
+        yield _indent(_dump_json(definition, indent), pad)
+        separator = "," + newline
+    yield newline + " " * (indent or 0) + "}"
+
+
+def _dump_json(value: object, indent: int | None) -> str:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json(indent=indent, exclude_unset=True, by_alias=True)
+    return to_json(value, indent=indent, by_alias=True).decode("utf-8")
+
+
+def _encode(name: str) -> str:
+    return to_json(name).decode("utf-8")
+
+
+def _indent(text: str, pad: str) -> str:
+    return text.replace("\n", "\n" + pad) if pad else text
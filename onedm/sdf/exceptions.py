@@ -1,6 +1,33 @@
+from typing import Sequence
+
+
 class InvalidLocalReferenceError(Exception):
     """Local reference could not be resolved"""
 
 
 class UnresolvableReferenceError(Exception):
     """Global reference could not be resolved"""
+
+
+class DocumentNotFoundError(KeyError):
+    """Document could not be found in registry"""
+
+
+class RegistryError(Exception):
+    """Registry could not be queried"""
+
+
+class UnresolvedReferencesError(Exception):
+    """Resolved document still contains global references"""
+
+    def __init__(self, unresolved: Sequence[tuple[str, str]]) -> None:
+        super().__init__(
+            "; ".join(
+                f"Unresolved sdfRef {ref} found in {ptr}" for ptr, ref in unresolved
+            )
+        )
+        self.unresolved = unresolved
+
+
+class PropertyAccessError(Exception):
+    """Property is not readable or writable"""
@@ -1,14 +1,19 @@
 """Conversion from native types to sdfData."""
 
-from typing import Any, NamedTuple, Type
+import copy
+from typing import Any, Hashable, Iterable, Mapping, NamedTuple, Type
+import weakref
 
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from pydantic.json_schema import GenerateJsonSchema
 from pydantic_core import core_schema
 
 from . import data
+from .document import Document
 
-data_adapter: TypeAdapter[data.Data] = TypeAdapter(data.Data)
+data_adapter: TypeAdapter[data.Data] = TypeAdapter(
+    data.Data, config=ConfigDict(defer_build=True)
+)
 
 
 class ModelResult(NamedTuple):
@@ -16,20 +21,107 @@ class ModelResult(NamedTuple):
     map: dict[str, dict]
 
 
-def data_from_type(type_: Type) -> data.Data:
+class CacheInfo(NamedTuple):
+    """Statistics of the type cache"""
+
+    hits: int
+    misses: int
+    size: int
+    """Number of cached results"""
+
+
+class _TypeCache:
+    """Results by type
+
+    Classes are referenced weakly so that cached results are dropped with
+    the class. Other hashable type expressions, like list[int], are
+    referenced strongly and unhashable ones are not cached.
+    """
+
+    def __init__(self) -> None:
+        self._classes: weakref.WeakKeyDictionary[type, dict[Hashable, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._others: dict[Any, dict[Hashable, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, type_: Any, key: Hashable) -> Any | None:
+        try:
+            result = self._results(type_).get(key)
+        except TypeError:
+            # Unhashable type
+            result = None
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, type_: Any, key: Hashable, result: Any) -> None:
+        try:
+            self._results(type_)[key] = result
+        except TypeError:
+            pass
+
+    def _results(self, type_: Any) -> dict[Hashable, Any]:
+        store = self._classes if isinstance(type_, type) else self._others
+        return store.setdefault(type_, {})
+
+    def info(self) -> CacheInfo:
+        size = sum(map(len, self._classes.values())) + sum(
+            map(len, self._others.values())
+        )
+        return CacheInfo(self.hits, self.misses, size)
+
+    def clear(self) -> None:
+        self._classes.clear()
+        self._others.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_cache = _TypeCache()
+
+
+def cache_info() -> CacheInfo:
+    """Get statistics of the cache used by data_from_type and
+    unresolved_data_from_type"""
+    return _cache.info()
+
+
+def clear_cache() -> None:
+    """Clear the cache used by data_from_type and unresolved_data_from_type"""
+    _cache.clear()
+
+
+def data_from_type(type_: Type, cache: bool = True) -> data.Data:
     """Create from a native Python or Pydantic type
 
     This function will create a resolved data model, which means it will not
     work with recursive models. Use unresolved_data_from_type for that purpose.
+
+    :param type_: Type to convert
+    :param cache: Reuse the result from a previous call with the same type,
+                  returned as a deep copy
     """
+    if cache:
+        cached: data.Data | None = _cache.get(type_, "resolved")
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
     schema = TypeAdapter(type_).json_schema(
         schema_generator=GenerateResolvedSDF, mode="serialization"
     )
-    return data_adapter.validate_python(schema)
+    result = data_adapter.validate_python(schema)
+
+    if cache:
+        _cache.put(type_, "resolved", result.model_copy(deep=True))
+    return result
 
 
 def unresolved_data_from_type(
-    type_: Type, ref_template="#/sdfData/{model}"
+    type_: Type, ref_template="#/sdfData/{model}", cache: bool = True
 ) -> ModelResult:
     """Create an unresolved definition
 
@@ -52,13 +144,96 @@ def unresolved_data_from_type(
 
     These can then be used to merge multiple definitions into a document or
     when using recursive models.
+
+    Results are cached per type and ref_template unless cache is False, and
+    returned as deep copies.
     """
+    key = ("unresolved", ref_template)
+    if cache:
+        cached: ModelResult | None = _cache.get(type_, key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
     schema = TypeAdapter(type_).json_schema(
         ref_template=ref_template, schema_generator=GenerateSDF, mode="serialization"
     )
     defs: dict[str, dict] = schema.pop("$defs", {})
     data_map = {ref_template.format(model=name): model for name, model in defs.items()}
-    return ModelResult(schema, data_map)
+    result = ModelResult(schema, data_map)
+
+    if cache:
+        _cache.put(type_, key, copy.deepcopy(result))
+    return result
+
+
+def document_from_types(
+    types: Iterable[Type] | Mapping[str, Type], **qualities: Any
+) -> Document:
+    """Create a document with sdfData definitions for many types
+
+    The schemas for all types are generated in a single pass, so definitions
+    of models and enums shared between the types are only generated once and
+    referenced from a single sdfData definition.
+
+    Example:
+
+        document = document_from_types([Room, Building], info={"title": "Example"})
+        # sdfData contains Room, Building, and all nested models and enums
+
+    :param types: Types to add, either named by their __name__ or by the keys
+                  of a mapping
+    :param qualities: Other top-level qualities of the document, e.g. info,
+                      namespace, and defaultNamespace
+    :raises ValueError: Types have the same name, or a name is also used by a
+                        generated definition
+    """
+    named_types = types if isinstance(types, Mapping) else _name_types(types)
+    generator = GenerateSDF(ref_template="#/sdfData/{model}")
+    schemas, defs = generator.generate_definitions(
+        [
+            (name, "serialization", TypeAdapter(type_).core_schema)
+            for name, type_ in named_types.items()
+        ]
+    )
+    sdf_data: dict[str, Any] = {}
+    for (name, _), schema in schemas.items():
+        if schema.get("sdfRef") == f"#/sdfData/{name}" and name in defs:
+            # The definition of the type itself is shared under the same name
+            continue
+        sdf_data[name] = schema
+    for def_name, definition in defs.items():
+        if def_name in sdf_data:
+            raise ValueError(
+                f"{def_name} is the name of both a type and a generated definition"
+            )
+        sdf_data[str(def_name)] = definition
+    _remove_json_refs(sdf_data)
+    return Document.model_validate({**qualities, "sdfData": sdf_data})
+
+
+def _name_types(types: Iterable[Type]) -> dict[str, Type]:
+    named_types: dict[str, Type] = {}
+    for type_ in types:
+        if not isinstance(type_, type):
+            raise ValueError(f"{type_} has no name, use a mapping to name it")
+        if named_types.get(type_.__name__, type_) is not type_:
+            raise ValueError(
+                f"More than one type is named {type_.__name__}, use a mapping to "
+                "name them"
+            )
+        named_types[type_.__name__] = type_
+    return named_types
+
+
+def _remove_json_refs(definition: Any) -> None:
+    # Pydantic needs $ref while generating, but it has no meaning in SDF
+    if isinstance(definition, dict):
+        definition.pop("$ref", None)
+        for value in definition.values():
+            _remove_json_refs(value)
+    elif isinstance(definition, list):
+        for value in definition:
+            _remove_json_refs(value)
 
 
 class GenerateSDF(GenerateJsonSchema):
@@ -0,0 +1,144 @@
+"""Query index over the definitions in a document"""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Any, Iterable, Union
+
+from . import definitions
+
+if TYPE_CHECKING:
+    from .document import Document
+
+IndexedDefinition = Union[
+    definitions.Thing,
+    definitions.Object,
+    definitions.Property,
+    definitions.Action,
+    definitions.Event,
+    definitions.Data,
+]
+
+# Model fields containing named definitions and their SDF keywords
+_GROUPS = {
+    "things": "sdfThing",
+    "objects": "sdfObject",
+    "properties": "sdfProperty",
+    "actions": "sdfAction",
+    "events": "sdfEvent",
+    "data": "sdfData",
+    "context": "sdfContext",
+}
+
+
+class DocumentIndex:
+    """Index of all named definitions in a document
+
+    Definitions are found in all sdfThing, sdfObject, sdfProperty, sdfAction,
+    sdfEvent, sdfData, and sdfContext groups, including nested things and
+    objects, and are identified by JSON pointers like
+    "#/sdfObject/Switch/sdfProperty/state".
+
+    The index is a snapshot and will not reflect later changes to the document.
+    """
+
+    def __init__(self, document: Document) -> None:
+        self._definitions: dict[str, IndexedDefinition] = {}
+        self._pointers: list[str] = []
+        self._secondary: dict[str, dict[Any, list[str]]] = {
+            "kind": {},
+            "type": {},
+            "unit": {},
+            "sdf_type": {},
+            "label": {},
+        }
+        self._add_children(document, "#")
+        self._pointers.sort()
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def __contains__(self, pointer: str) -> bool:
+        return pointer in self._definitions
+
+    def __getitem__(self, pointer: str) -> IndexedDefinition:
+        return self._definitions[pointer]
+
+    def get(self, pointer: str) -> IndexedDefinition | None:
+        """Get a definition by its JSON pointer"""
+        return self._definitions.get(pointer)
+
+    def find(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        kind: str | None = None,
+        type: str | None = None,  # pylint: disable=redefined-builtin
+        unit: str | None = None,
+        sdf_type: str | None = None,
+        label: str | None = None,
+        under: str | None = None,
+    ) -> dict[str, IndexedDefinition]:
+        """Find definitions matching all given criteria
+
+        :param kind: SDF keyword of the group, e.g. "sdfProperty"
+        :param type: Data type, e.g. "integer"
+        :param unit: Unit, e.g. "Cel"
+        :param sdf_type: sdfType, e.g. "unix-time"
+        :param label: Exact label
+        :param under: Only definitions nested under this JSON pointer
+        :returns: Matching definitions by JSON pointer, sorted by pointer
+        """
+        candidates: list[Iterable[str]] = []
+        for name, value in (
+            ("kind", kind),
+            ("type", type),
+            ("unit", unit),
+            ("sdf_type", sdf_type),
+            ("label", label),
+        ):
+            if value is not None:
+                candidates.append(self._secondary[name].get(value, []))
+        if under is not None:
+            candidates.append(self._iter_under(under))
+
+        if not candidates:
+            pointers: Iterable[str] = self._pointers
+        else:
+            candidate_sets = sorted(map(set, candidates), key=len)
+            pointers = sorted(candidate_sets[0].intersection(*candidate_sets[1:]))
+        return {pointer: self._definitions[pointer] for pointer in pointers}
+
+    def values(self, name: str) -> list[Any]:
+        """Get all distinct values of an indexed quality
+
+        :param name: One of "kind", "type", "unit", "sdf_type", or "label"
+        """
+        return list(self._secondary[name])
+
+    def _iter_under(self, prefix: str) -> Iterable[str]:
+        prefix = prefix.rstrip("/") + "/"
+        start = bisect.bisect_left(self._pointers, prefix)
+        for pointer in self._pointers[start:]:
+            if not pointer.startswith(prefix):
+                break
+            yield pointer
+
+    def _add_children(self, parent: Any, path: str) -> None:
+        for field, kind in _GROUPS.items():
+            children = getattr(parent, field, None)
+            if not children:
+                continue
+            for name, definition in children.items():
+                pointer = f"{path}/{kind}/{name}"
+                self._add(pointer, kind, definition)
+                if isinstance(definition, (definitions.Thing, definitions.Object)):
+                    self._add_children(definition, pointer)
+
+    def _add(self, pointer: str, kind: str, definition: IndexedDefinition) -> None:
+        self._definitions[pointer] = definition
+        self._pointers.append(pointer)
+        self._secondary["kind"].setdefault(kind, []).append(pointer)
+        for name in ("type", "unit", "sdf_type", "label"):
+            value = getattr(definition, name, None)
+            if value is not None:
+                self._secondary[name].setdefault(value, []).append(pointer)
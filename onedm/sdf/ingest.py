@@ -0,0 +1,229 @@
+"""Validation of property and event streams with asyncio
+
+pipeline = IngestPipeline(document)
+
+async def produce():
+    async for pointer, payload in stream:
+        await pipeline.put(pointer, payload)
+    await pipeline.close()
+
+asyncio.create_task(produce())
+async for result in pipeline:
+    ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+import functools
+from typing import Any, AsyncIterator, Callable, NamedTuple
+
+from pydantic import ValidationError
+
+from . import definitions, tracing
+from .data import DataQualities
+from .document import Document
+
+Validator = Callable[[Any], Any]
+BatchResult = tuple[Any, ValidationError | None]
+
+
+class IngestResult(NamedTuple):
+    """Validation result of a single message"""
+
+    pointer: str
+    payload: Any
+    value: Any
+    """Validated value, None if invalid"""
+    error: Exception | None
+    """ValidationError for invalid payloads or KeyError for unknown pointers"""
+
+
+class IngestPipeline:
+    """Validates (pointer, payload) messages in batches off the event loop
+
+    Pointers refer to data and properties in the document, to actions for
+    their input data, or to events for their output data. Messages are
+    collected in windows of up to batch_size messages, grouped by pointer,
+    and validated as one batch per pointer in the executor. Results are
+    yielded in the same order as the messages were put.
+
+    Both the incoming messages and the windows being validated are bounded,
+    so put() waits when the consumer falls behind.
+    """
+
+    def __init__(
+        self,
+        document: Document,
+        *,
+        batch_size: int = 64,
+        max_queued: int = 1024,
+        max_windows: int = 4,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        :param document: Document with the definitions
+        :param batch_size: Maximum number of messages per window
+        :param max_queued: Maximum number of messages waiting to be validated
+        :param max_windows: Maximum number of windows validated concurrently
+                            or waiting to be consumed
+        :param executor: Executor to validate in, default is the event loop's
+                         default executor. It must run in this process, as
+                         enumerations generated for sdfChoice, and values
+                         converted to them, cannot be pickled.
+        :raises TypeError: A process pool executor was given
+        """
+        if isinstance(executor, ProcessPoolExecutor):
+            raise TypeError("Validation must run in threads, not processes")
+        self._document = document
+        self._batch_size = batch_size
+        self._executor = executor
+        # Functions validating batches by pointer
+        self._validators: dict[str, Callable[[list[Any]], list[BatchResult]]] = {}
+        self._messages: asyncio.Queue[tuple[str, Any] | None] = asyncio.Queue(
+            max_queued
+        )
+        self._windows: asyncio.Queue[asyncio.Future[list[IngestResult]] | None] = (
+            asyncio.Queue(max_windows)
+        )
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    async def put(self, pointer: str, payload: Any) -> None:
+        """Add a message, waiting if too many are queued"""
+        if self._closed:
+            raise RuntimeError("Pipeline is closed")
+        self._start()
+        await self._messages.put((pointer, payload))
+
+    async def close(self) -> None:
+        """Stop accepting messages
+
+        Iteration ends after the results of all messages put before.
+        """
+        if not self._closed:
+            self._closed = True
+            self._start()
+            await self._messages.put(None)
+
+    async def __aiter__(self) -> AsyncIterator[IngestResult]:
+        self._start()
+        while True:
+            window = await self._windows.get()
+            if window is None:
+                break
+            for result in await window:
+                yield result
+
+    def _start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        done = False
+        while not done:
+            message = await self._messages.get()
+            if message is None:
+                break
+            window = [message]
+            # Add messages already waiting, without waiting for more
+            while len(window) < self._batch_size and not self._messages.empty():
+                message = self._messages.get_nowait()
+                if message is None:
+                    done = True
+                    break
+                window.append(message)
+            await self._windows.put(
+                asyncio.ensure_future(self._validate_window(window))
+            )
+        await self._windows.put(None)
+
+    async def _validate_window(
+        self, window: list[tuple[str, Any]]
+    ) -> list[IngestResult]:
+        loop = asyncio.get_running_loop()
+        groups: dict[str, list[int]] = {}
+        for index, (pointer, _) in enumerate(window):
+            groups.setdefault(pointer, []).append(index)
+
+        results: list[IngestResult | None] = [None] * len(window)
+        batches = []
+        for pointer, indexes in groups.items():
+            try:
+                validator = self._get_validator(pointer)
+            except KeyError as exc:
+                for index in indexes:
+                    results[index] = IngestResult(pointer, window[index][1], None, exc)
+                continue
+            payloads = [window[index][1] for index in indexes]
+            batches.append(
+                (
+                    pointer,
+                    indexes,
+                    loop.run_in_executor(self._executor, validator, payloads),
+                )
+            )
+
+        for pointer, indexes, batch in batches:
+            for index, (value, error) in zip(indexes, await batch):
+                results[index] = IngestResult(pointer, window[index][1], value, error)
+        return results  # type: ignore[return-value]
+
+    def _get_validator(self, pointer: str) -> Callable[[list[Any]], list[BatchResult]]:
+        validator = self._validators.get(pointer)
+        if validator is None:
+            definition = get_data_definition(self._document, pointer)
+            validator = functools.partial(
+                validate_batch, definition, validator=definition.get_validator()
+            )
+            self._validators[pointer] = validator
+        return validator
+
+
+def validate_batch(
+    definition: DataQualities,
+    payloads: list[Any],
+    validator: Validator | None = None,
+) -> list[BatchResult]:
+    """Validate many payloads with the same definition
+
+    :param definition: Definition to validate with
+    :param payloads: Values to validate
+    :param validator: Validator built by definition.get_validator(), to reuse
+                      it between batches
+    :returns: Tuples of validated value, or None, and validation error, or None
+    """
+    if validator is None:
+        validator = definition.get_validator()
+    results: list[BatchResult] = []
+    with tracing.span(
+        "sdf.validate_batch",
+        type=definition.type,
+        definition=definition,
+        size=len(payloads),
+    ) as span:
+        errors = []
+        for payload in payloads:
+            try:
+                results.append((validator(payload), None))
+            except ValidationError as exc:
+                results.append((None, exc))
+                errors.append(exc)
+        span.set("errors", errors)
+    return results
+
+
+def get_data_definition(document: Document, pointer: str) -> DataQualities:
+    """Get the data definition for messages to a pointer
+
+    :raises KeyError: No data is defined for the pointer
+    """
+    definition = document.index.get(pointer)
+    if isinstance(definition, DataQualities):
+        return definition
+    if isinstance(definition, definitions.Action) and definition.input_data:
+        return definition.input_data
+    if isinstance(definition, definitions.Event) and definition.output_data:
+        return definition.output_data
+    raise KeyError(f"No data defined for {pointer}")
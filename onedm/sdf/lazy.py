@@ -0,0 +1,163 @@
+"""Lazy validation of definitions
+
+When a document is validated with LAZY_CONTEXT, the definition sections of
+Document, Thing and Object (sdfThing, sdfObject, sdfProperty etc.) keep the
+raw definitions and validate them into models on first access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import ItemsView, KeysView, ValuesView
+import copy
+import functools
+from typing import Any, Iterator, TypeVar, get_args
+
+from pydantic import TypeAdapter, ValidationInfo
+
+LAZY_CONTEXT = {"lazy": True}
+
+T = TypeVar("T")
+
+
+class LazyDict(dict[str, T]):
+    """A dictionary of definitions validated on first access
+
+    Validated definitions are memoised. Use materialize() to get a plain
+    dictionary with all definitions validated. Copies and pickles keep the
+    definitions not yet validated as they are.
+    """
+
+    def __init__(
+        self, raw: dict[str, Any] | None = None, value_type: Any = None
+    ) -> None:
+        """
+        :param raw: Definitions to validate on first access
+        :param value_type: Type to validate the definitions as
+        """
+        super().__init__(raw or {})
+        self._value_type = value_type
+        self._pending: set[str] = set(self)
+
+    def __getitem__(self, key: str) -> T:
+        value = super().__getitem__(key)
+        if key in self._pending:
+            assert self._value_type is not None
+            adapter = _get_adapter(self._value_type)
+            value = adapter.validate_python(value, context=LAZY_CONTEXT)
+            super().__setitem__(key, value)
+            self._pending.discard(key)
+        return value
+
+    def __setitem__(self, key: str, value: T) -> None:
+        super().__setitem__(key, value)
+        self._pending.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._pending.discard(key)
+
+    def __eq__(self, other: object) -> bool:
+        return self.materialize() == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def __reduce__(self):
+        return (
+            _rebuild,
+            (dict(super().items()), self._pending, self._value_type),
+        )
+
+    def __iter__(self) -> Iterator[str]:  # pylint: disable=useless-parent-delegation
+        # Overriding iteration stops dict(), {**lazy} and dict.update() from
+        # copying the raw values directly, they use keys() and __getitem__()
+        return super().__iter__()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key: str, *args: Any) -> Any:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        return KeysView(self)
+
+    def items(self) -> ItemsView[str, T]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView[T]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def copy(self) -> dict[str, T]:
+        return self.materialize()
+
+    def materialize(self) -> dict[str, T]:
+        """Validate all definitions and return them as a plain dictionary"""
+        return {key: self[key] for key in self}
+
+    @property
+    def pending(self) -> int:
+        """Number of definitions not yet validated"""
+        return len(self._pending)
+
+
+def validate_lazily(cls, value: Any, handler, info: ValidationInfo) -> Any:
+    """Wrap validator for definition sections"""
+    if (
+        info.context
+        and info.context.get("lazy")
+        and isinstance(value, dict)
+        and not isinstance(value, LazyDict)
+        and info.field_name is not None
+    ):
+        annotation = cls.model_fields[info.field_name].annotation
+        _, value_type = get_args(annotation)
+        return LazyDict(value, value_type)
+    return handler(value)
+
+
+def serialize_materialized(self, next_):
+    """Wrap model serializer validating all lazy definitions first
+
+    The serializer reads the dictionaries directly, so a copy of the model
+    with plain dictionaries is serialized and the model itself is unchanged.
+    There is no return annotation, which would replace the serialization
+    schema of the model.
+    """
+    lazy_fields = {
+        name: value.materialize()
+        for name, value in self.__dict__.items()
+        if isinstance(value, LazyDict)
+    }
+    if not lazy_fields:
+        return next_(self)
+    materialized = copy.copy(self)
+    materialized.__dict__.update(lazy_fields)
+    return next_(materialized)
+
+
+def _rebuild(items: dict[str, Any], pending: set[str], value_type: Any) -> LazyDict:
+    lazy_dict: LazyDict = LazyDict(items, value_type)
+    lazy_dict._pending = set(pending)  # pylint: disable=protected-access
+    return lazy_dict
+
+
+@functools.cache
+def _get_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
@@ -1,32 +1,134 @@
 """Loading of SDF files"""
 
+import importlib
 import io
 import json
-from typing import Any
+from typing import Any, Callable
 
+from . import tracing
+from .cache import DocumentCache
 from .document import Document
+from .lazy import LAZY_CONTEXT
 from .registry import Registry, NullRegistry
 from .resolver import Resolver
 
 NULL_REGISTRY = NullRegistry()
 
+JSONLoads = Callable[[bytes | str], Any]
+
+
+def get_json_backend(name: str = "json") -> JSONLoads:
+    """Get a function for parsing JSON
+
+    :param name: "json" for the standard library, "orjson" or "msgspec" for
+                 the respective package, or "auto" for the fastest one
+                 installed
+    :raises ImportError: If the package is not installed
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return get_json_backend(candidate)
+            except ImportError:
+                pass
+        return json.loads
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        return importlib.import_module("orjson").loads
+    if name == "msgspec":
+        return importlib.import_module("msgspec.json").decode
+    raise ValueError(f"Unknown JSON backend {name}")
+
 
 class SDFLoader:
 
-    def __init__(self, registry: Registry = NULL_REGISTRY) -> None:
-        self.root: dict[str, Any] = {}
+    def __init__(
+        self,
+        registry: Registry = NULL_REGISTRY,
+        json_backend: str | JSONLoads = "json",
+        cache: DocumentCache | None = None,
+        lazy: bool = False,
+    ) -> None:
+        """
+        :param registry: Registry for resolving global references
+        :param json_backend: Name of a JSON backend (see get_json_backend())
+                             or a function for parsing JSON
+        :param cache: Cache for resolved and validated documents
+        :param lazy: Validate definitions on first access,
+                     see Document.model_validate_lazy()
+        """
+        self.cache = cache
+        self.lazy = lazy
+        self._root: dict[str, Any] | None = {}
+        self._raw: bytes | str | None = None
         self.registry = registry
+        self._json_loads = (
+            get_json_backend(json_backend)
+            if isinstance(json_backend, str)
+            else json_backend
+        )
+
+    @property
+    def root(self) -> dict[str, Any]:
+        """The unresolved document"""
+        if self._root is None:
+            assert self._raw is not None
+            with tracing.span("sdf.parse", size=len(self._raw)):
+                self._root = self._json_loads(self._raw)
+        return self._root
+
+    @root.setter
+    def root(self, doc: dict[str, Any]) -> None:
+        self._root = doc
+        self._raw = None
 
     def load_file(self, path):
-        with open(path, "r", encoding="utf-8") as fp:
-            self.load_from_fp(fp)
+        with open(path, "rb") as fp:
+            self.load_bytes(fp.read())
 
     def load_from_fp(self, fp: io.TextIOBase):
-        self.load_from_dict(json.load(fp))
+        self.load_bytes(fp.read())
 
     def load_from_dict(self, doc: dict):
         self.root = doc
 
+    def load_bytes(self, data: bytes | str):
+        """Load a JSON encoded document
+
+        The document is not parsed until needed.
+        """
+        self._root = None
+        self._raw = data
+
     def to_sdf(self) -> Document:
-        doc = Resolver(self.root, self.registry).resolve(self.root)
-        return Document.model_validate(doc)
+        source = (
+            self._raw if self._root is None and self._raw is not None else self.root
+        )
+        if self.cache is not None:
+            cached = self.cache.get(source, self.registry, self.lazy)
+            if cached is not None:
+                return cached
+
+        context = LAZY_CONTEXT if self.lazy else None
+        if isinstance(source, (bytes, str)) and not _has_references(source):
+            # Nothing to resolve, let Pydantic parse the JSON directly
+            with tracing.span("sdf.validate_model", model="Document", json=True):
+                document = Document.model_validate_json(source, context=context)
+            dependencies = []
+        else:
+            resolver = Resolver(self.root, self.registry)
+            resolved = resolver.resolve(self.root)
+            with tracing.span("sdf.validate_model", model="Document", json=False):
+                document = Document.model_validate(resolved, context=context)
+            dependencies = resolver.dereferenced
+
+        if self.cache is not None:
+            self.cache.put(source, self.registry, document, dependencies, self.lazy)
+        return document
+
+
+def _has_references(raw: bytes | str) -> bool:
+    if isinstance(raw, bytes):
+        return b'"sdfRef"' in raw
+    return '"sdfRef"' in raw
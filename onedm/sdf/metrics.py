@@ -0,0 +1,179 @@
+"""Validation metrics per definition
+
+ValidationMetrics is a tracer collecting call counts, failures, and latency
+histograms for DataQualities.validate_input and batches validated with
+ingest.validate_batch:
+
+    metrics = ValidationMetrics(document)
+    with tracing.use_tracer(metrics):
+        ...
+    metrics["#/sdfObject/Switch/sdfProperty/level"].failures
+    # {"less_than_equal": 3}
+
+Combine it with other tracers using tracing.MultiTracer.
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+import json
+import time
+from typing import IO, Any, Iterator, Sequence
+
+from pydantic import ValidationError
+
+from . import definitions, tracing
+from .data import DataQualities
+from .document import Document
+
+# Upper bounds of histogram buckets in seconds
+DEFAULT_BUCKETS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4, 1e-3, 1e-2)
+
+UNNAMED = "unnamed"
+"""Name of metrics for definitions not added to the collector"""
+
+
+@dataclass
+class DefinitionMetrics:
+    """Metrics of a single definition"""
+
+    calls: int = 0
+    failed_calls: int = 0
+    """Number of calls raising a validation error"""
+    failures: dict[str, int] = field(default_factory=dict)
+    """Number of errors by Pydantic error type"""
+    total_time: float = 0.0
+    """Total time spent validating in seconds"""
+    histogram: list[int] = field(default_factory=list)
+    """Number of calls per bucket, the last one counting slower calls"""
+
+
+class ValidationMetrics(tracing.Tracer):
+    """Collects metrics of validate_input calls by definition
+
+    Each value in a batch counts as a call taking the average time of the
+    values in the batch.
+
+    Definitions are named by JSON pointers when added with add_document() or
+    by any name when added with add_definition(). Calls for other
+    definitions are collected under UNNAMED.
+    """
+
+    def __init__(
+        self,
+        document: Document | None = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        :param document: Document to add definitions from
+        :param buckets: Upper bounds of histogram buckets in seconds
+        """
+        self.buckets = tuple(buckets)
+        # Names and the definitions themselves, keeping them alive, by id
+        self._names: dict[int, tuple[str, DataQualities]] = {}
+        self._metrics: dict[str, DefinitionMetrics] = {}
+        if document is not None:
+            self.add_document(document)
+
+    def add_definition(self, name: str, definition: DataQualities) -> None:
+        """Collect metrics for a definition under the given name"""
+        self._names[id(definition)] = (name, definition)
+
+    def add_document(self, document: Document) -> None:
+        """Collect metrics for all data and properties in a document
+
+        Includes input and output data of actions and events.
+        """
+        for pointer, definition in document.index.find().items():
+            if isinstance(definition, DataQualities):
+                self.add_definition(pointer, definition)
+            elif isinstance(definition, definitions.Action):
+                if definition.input_data is not None:
+                    self.add_definition(
+                        f"{pointer}/sdfInputData", definition.input_data
+                    )
+                if definition.output_data is not None:
+                    self.add_definition(
+                        f"{pointer}/sdfOutputData", definition.output_data
+                    )
+            elif isinstance(definition, definitions.Event):
+                if definition.output_data is not None:
+                    self.add_definition(
+                        f"{pointer}/sdfOutputData", definition.output_data
+                    )
+
+    def __getitem__(self, name: str) -> DefinitionMetrics:
+        return self._metrics[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._metrics
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._metrics)
+
+    def reset(self) -> None:
+        """Clear all collected metrics"""
+        self._metrics.clear()
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> float | None:
+        if name not in ("sdf.validate_value", "sdf.validate_batch"):
+            return None
+        return time.perf_counter()
+
+    def end_span(
+        self,
+        name: str,
+        token: float | None,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        if token is None:
+            return
+        duration = time.perf_counter() - token
+        if name == "sdf.validate_batch":
+            calls = attributes["size"]
+            errors = attributes.get("errors", [])
+        else:
+            calls = 1
+            errors = [error] if isinstance(error, ValidationError) else []
+        if not calls:
+            return
+        named = self._names.get(id(attributes["definition"]))
+        metrics = self._get_metrics(named[0] if named is not None else UNNAMED)
+        metrics.calls += calls
+        metrics.total_time += duration
+        metrics.histogram[bisect.bisect_left(self.buckets, duration / calls)] += calls
+        metrics.failed_calls += len(errors)
+        for validation_error in errors:
+            for details in validation_error.errors(include_url=False):
+                metrics.failures[details["type"]] = (
+                    metrics.failures.get(details["type"], 0) + 1
+                )
+
+    def _get_metrics(self, name: str) -> DefinitionMetrics:
+        metrics = self._metrics.get(name)
+        if metrics is None:
+            metrics = DefinitionMetrics(histogram=[0] * (len(self.buckets) + 1))
+            self._metrics[name] = metrics
+        return metrics
+
+    def to_json(self) -> dict[str, Any]:
+        """Get all metrics as JSON compatible data"""
+        return {
+            "buckets": list(self.buckets),
+            "definitions": {
+                name: {
+                    "calls": metrics.calls,
+                    "failed_calls": metrics.failed_calls,
+                    "failures": metrics.failures,
+                    "total_time": metrics.total_time,
+                    "histogram": metrics.histogram,
+                }
+                for name, metrics in self._metrics.items()
+            },
+        }
+
+    def dump(self, fp: IO[str], indent: int | None = 2) -> None:
+        """Write all metrics as JSON"""
+        json.dump(self.to_json(), fp, indent=indent)
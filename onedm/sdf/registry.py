@@ -1,11 +1,47 @@
 from abc import ABC, abstractmethod
 import bisect
+import functools
+import hashlib
+import heapq
+import http.client
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Any, Iterable
+import queue
+import re
+import sqlite3
+import time
+from typing import Any, Callable, Generic, Iterable, Iterator, NamedTuple, TypeVar
+from urllib.parse import urlencode, urlsplit
+import zipfile
+
+from . import exceptions
 
 NamespaceURI = str
 Definition = dict[str, Any]
+VersionKey = tuple[str | int, ...]
+
+T = TypeVar("T")
+
+DEFINITION_GROUPS = (
+    "sdfThing",
+    "sdfObject",
+    "sdfProperty",
+    "sdfAction",
+    "sdfEvent",
+    "sdfData",
+    "sdfContext",
+)
+
+
+class Fragment(NamedTuple):
+    """A definition found in a registry"""
+
+    definition: Definition
+    """The unresolved definition"""
+    load_document: Callable[[], dict]
+    """Load the complete document containing the definition"""
 
 
 class Registry(ABC):  # pylint: disable=too-few-public-methods
@@ -19,6 +55,45 @@ class Registry(ABC):  # pylint: disable=too-few-public-methods
         """
         raise NotImplementedError
 
+    def get_document(self, ns: NamespaceURI, version: str) -> dict:
+        """Get the document with a specific version in a given namespace URI
+
+        Versions are compared using version_key().
+
+        :raises DocumentNotFoundError: If there is no such document
+        """
+        key = version_key(version)
+        for model in self.get_documents(ns):
+            model_key = version_key(_get_version_from_model(model))
+            if model_key == key:
+                return model
+            if model_key < key:
+                break
+        raise exceptions.DocumentNotFoundError(f"No version {version} of {ns}")
+
+    def get_latest(self, ns: NamespaceURI) -> dict:
+        """Get the document with the latest version in a given namespace URI
+
+        :raises DocumentNotFoundError: If there are no documents
+        """
+        for model in self.get_documents(ns):
+            return model
+        raise exceptions.DocumentNotFoundError(f"No documents in {ns}")
+
+    def get_fragments(self, ns: NamespaceURI, path: str) -> Iterable[Fragment]:
+        """Get all definitions found at a JSON pointer in a given namespace URI
+
+        The definitions should be sorted by document version in reverse order.
+        The default implementation walks the documents from get_documents(),
+        but registries may override it to avoid loading complete documents.
+        """
+        for model in self.get_documents(ns):
+            try:
+                definition = get_by_pointer(model, path)
+            except KeyError:
+                continue
+            yield Fragment(definition, functools.partial(_identity, model))
+
 
 class NullRegistry(Registry):  # pylint: disable=too-few-public-methods
     """A registry with no documents"""
@@ -27,36 +102,124 @@ class NullRegistry(Registry):  # pylint: disable=too-few-public-methods
         return []
 
 
-class CombinedRegistry(Registry):  # pylint: disable=too-few-public-methods
-    """A registry combining multiple registries"""
+class CombinedRegistry(Registry):
+    """A registry combining multiple registries
+
+    Since each registry returns its documents sorted by version, they are
+    merged lazily so that older documents are not loaded unless needed.
+    """
 
-    def __init__(self, registries: list[Registry]):
+    def __init__(self, registries: list[Registry], cache: bool = False):
+        """
+        :param registries: Registries to combine
+        :param cache: Remember the merged documents per namespace so that
+                      repeated lookups don't query the registries again.
+                      Call clear_cache() if the registries change.
+        """
         self.registries = registries
+        self._cache: dict[NamespaceURI, _ReplayableIterator] | None = (
+            {} if cache else None
+        )
+
+    def clear_cache(self) -> None:
+        """Forget all cached documents"""
+        if self._cache is not None:
+            self._cache.clear()
 
     def get_documents(self, ns: NamespaceURI) -> Iterable[dict]:
-        models = (
-            model
-            for registry in self.registries
-            for model in registry.get_documents(ns)
+        if self._cache is None:
+            return self._merge(ns)
+        if ns not in self._cache:
+            self._cache[ns] = _ReplayableIterator(self._merge(ns))
+        return iter(self._cache[ns])
+
+    def get_document(self, ns: NamespaceURI, version: str) -> dict:
+        for registry in self.registries:
+            try:
+                return registry.get_document(ns, version)
+            except exceptions.DocumentNotFoundError:
+                pass
+        raise exceptions.DocumentNotFoundError(f"No version {version} of {ns}")
+
+    def _merge(self, ns: NamespaceURI) -> Iterator[dict]:
+        return heapq.merge(
+            *(registry.get_documents(ns) for registry in self.registries),
+            key=_get_version_key_from_model,
+            reverse=True,
         )
-        return sorted(models, key=_get_version_from_model, reverse=True)
+
+
+class _ReplayableIterator:  # pylint: disable=too-few-public-methods
+    """Consumes an iterator lazily while remembering the produced items"""
+
+    def __init__(self, iterator: Iterator[dict]) -> None:
+        self._iterator = iterator
+        self._items: list[dict] = []
+
+    def __iter__(self) -> Iterator[dict]:
+        pos = 0
+        while True:
+            if pos == len(self._items):
+                try:
+                    self._items.append(next(self._iterator))
+                except StopIteration:
+                    return
+            yield self._items[pos]
+            pos += 1
+
+
+class _VersionIndex(Generic[T]):
+    """Items sorted by version per namespace"""
+
+    def __init__(self) -> None:
+        self._keys: dict[NamespaceURI, list[VersionKey]] = {}
+        self._items: dict[NamespaceURI, list[T]] = {}
+
+    def add(self, ns: NamespaceURI, version: str, item: T) -> None:
+        key = version_key(version)
+        keys = self._keys.setdefault(ns, [])
+        pos = bisect.bisect_left(keys, key)
+        keys.insert(pos, key)
+        self._items.setdefault(ns, []).insert(pos, item)
+
+    def newest_first(self, ns: NamespaceURI) -> Iterator[T]:
+        return reversed(self._items.get(ns, []))
+
+    def find(self, ns: NamespaceURI, version: str) -> T:
+        key = version_key(version)
+        keys = self._keys.get(ns, [])
+        pos = bisect.bisect_right(keys, key) - 1
+        if pos < 0 or keys[pos] != key:
+            raise exceptions.DocumentNotFoundError(f"No version {version} of {ns}")
+        return self._items[ns][pos]
+
+    def latest(self, ns: NamespaceURI) -> T:
+        items = self._items.get(ns)
+        if not items:
+            raise exceptions.DocumentNotFoundError(f"No documents in {ns}")
+        return items[-1]
 
 
 class InMemoryRegistry(Registry):
     """A registry with pre-loaded models"""
 
     def __init__(self) -> None:
-        self._db: dict[NamespaceURI, list[dict]] = {}
+        self._db: _VersionIndex[dict] = _VersionIndex()
 
     def add_document(self, model: dict) -> None:
         """Add a document"""
         assert "defaultNamespace" in model, "Model must have a defaultNamespace"
         ns: NamespaceURI = model["namespace"][model["defaultNamespace"]]
-        models = self._db.setdefault(ns, [])
-        bisect.insort_left(models, model, key=_get_version_from_model)
+        self._db.add(ns, _get_version_from_model(model), model)
 
     def get_documents(self, ns: NamespaceURI) -> Iterable[dict]:
-        return reversed(self._db.get(ns, []))
+        return self._db.newest_first(ns)
+
+    def get_document(self, ns: NamespaceURI, version: str) -> dict:
+        return self._db.find(ns, version)
+
+    def get_latest(self, ns: NamespaceURI) -> dict:
+        return self._db.latest(ns)
 
 
 class FileBasedRegistry(Registry):
@@ -71,13 +234,12 @@ class FileBasedRegistry(Registry):
 
     def __init__(self, models_dir: Path | str) -> None:
         self._dir = Path(models_dir)
-        self._lookup: dict[NamespaceURI, list[Path]] = {}
+        self._lookup: _VersionIndex[Path] = _VersionIndex()
         self.update()
 
     def update(self) -> None:
         """Scan directory for models"""
-        self._lookup = {}
-        version_lookup: dict[NamespaceURI, list[str]] = {}
+        self._lookup = _VersionIndex()
 
         # Populate lookup
         for path in self._dir.rglob("*.sdf.json"):
@@ -87,12 +249,7 @@ class FileBasedRegistry(Registry):
                 continue
 
             ns: NamespaceURI = model["namespace"][model["defaultNamespace"]]
-            version = _get_version_from_model(model)
-            models = self._lookup.setdefault(ns, [])
-            versions = version_lookup.setdefault(ns, [])
-            pos = bisect.bisect_left(versions, version)
-            models.insert(pos, path)
-            versions.insert(pos, version)
+            self._lookup.add(ns, _get_version_from_model(model), path)
 
     @staticmethod
     def _get_model_from_path(path: Path) -> dict:
@@ -100,8 +257,467 @@ class FileBasedRegistry(Registry):
             return json.load(fp)
 
     def get_documents(self, ns: NamespaceURI) -> Iterable[dict]:
-        return map(self._get_model_from_path, reversed(self._lookup.get(ns, [])))
+        return map(self._get_model_from_path, self._lookup.newest_first(ns))
+
+    def get_document(self, ns: NamespaceURI, version: str) -> dict:
+        return self._get_model_from_path(self._lookup.find(ns, version))
+
+    def get_latest(self, ns: NamespaceURI) -> dict:
+        return self._get_model_from_path(self._lookup.latest(ns))
+
+
+class ZipRegistry(Registry):
+    """A registry based on files in a zip archive
+
+    Works like FileBasedRegistry but for all members with .sdf.json extension
+    in a single archive. The archive is kept open and members are decompressed
+    on demand when get_documents() is called, with the most recently used
+    documents cached.
+    """
+
+    def __init__(
+        self,
+        archive: Path | str,
+        use_mmap: bool = False,
+        cache_size: int | None = 128,
+    ) -> None:
+        """
+        :param archive: Path to the zip file
+        :param use_mmap: Memory-map the archive instead of reading it through
+                         a regular file object
+        :param cache_size: Maximum number of parsed documents to cache,
+                           None for unlimited
+        """
+        self._path = Path(archive)
+        self._use_mmap = use_mmap
+        self._file: Any = None
+        self._zip: zipfile.ZipFile | None = None
+        self._lookup: _VersionIndex[str] = _VersionIndex()
+        self._get_cached_model = functools.lru_cache(maxsize=cache_size)(
+            self._get_model_from_member
+        )
+        self.update()
+
+    def update(self) -> None:
+        """(Re-)open the archive and index its models"""
+        self.close()
+        # pylint: disable=consider-using-with
+        self._file = self._path.open("rb")
+        if self._use_mmap:
+            mapped = _MappedFile(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._file.close()
+            self._file = mapped
+        # Reads the central directory once
+        self._zip = zipfile.ZipFile(self._file)
+        # pylint: enable=consider-using-with
+
+        self._lookup = _VersionIndex()
+
+        # Populate lookup
+        for name in self._zip.namelist():
+            if not name.endswith(".sdf.json"):
+                continue
+            model = self._get_model_from_member(name)
+            if "defaultNamespace" not in model:
+                # Skip models that don't contribute to a namespace
+                continue
+
+            ns: NamespaceURI = model["namespace"][model["defaultNamespace"]]
+            self._lookup.add(ns, _get_version_from_model(model), name)
+
+    def close(self) -> None:
+        """Close the archive"""
+        self._get_cached_model.cache_clear()
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _get_model_from_member(self, name: str) -> dict:
+        assert self._zip is not None, "Archive is closed"
+        return json.loads(self._zip.read(name))
+
+    def get_documents(self, ns: NamespaceURI) -> Iterable[dict]:
+        return map(self._get_cached_model, self._lookup.newest_first(ns))
+
+    def get_document(self, ns: NamespaceURI, version: str) -> dict:
+        return self._get_cached_model(self._lookup.find(ns, version))
+
+    def get_latest(self, ns: NamespaceURI) -> dict:
+        return self._get_cached_model(self._lookup.latest(ns))
+
+
+class _MappedFile(mmap.mmap):
+    """Memory-mapped file usable as a file object by zipfile"""
+
+    def seekable(self) -> bool:
+        return True
+
+
+class SQLiteRegistry(Registry):
+    """A registry stored in an SQLite database
+
+    Documents are stored as JSON text indexed by namespace and version.
+    Unless disabled, every named definition (e.g. /sdfObject/foo/sdfProperty/bar)
+    is also stored separately so that references can be dereferenced without
+    loading and parsing the complete document.
+    """
+
+    def __init__(
+        self, database: Path | str = ":memory:", index_fragments: bool = True
+    ) -> None:
+        self._conn = sqlite3.connect(database)
+        self._conn.create_collation("sdf_version", _compare_versions)
+        self._index_fragments = index_fragments
+        with self._conn:
+            self._conn.executescript(_SQLITE_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
+    def add_document(self, model: dict) -> None:
+        """Add a document"""
+        assert "defaultNamespace" in model, "Model must have a defaultNamespace"
+        with self._conn:
+            self._insert(model, json.dumps(model))
+
+    def import_directory(self, models_dir: Path | str) -> int:
+        """Import all .sdf.json files in a directory recursively
+
+        Models that don't contribute to a namespace are skipped.
+        All documents are imported in a single transaction.
+
+        :returns: Number of imported documents
+        """
+        count = 0
+        with self._conn:
+            for path in Path(models_dir).rglob("*.sdf.json"):
+                content = path.read_text(encoding="utf-8")
+                model = json.loads(content)
+                if "defaultNamespace" not in model:
+                    continue
+                self._insert(model, content)
+                count += 1
+        return count
+
+    def _insert(self, model: dict, content: str) -> None:
+        ns: NamespaceURI = model["namespace"][model["defaultNamespace"]]
+        cursor = self._conn.execute(
+            "INSERT INTO documents (namespace, version, content) VALUES (?, ?, ?)",
+            (ns, _get_version_from_model(model), content),
+        )
+        if self._index_fragments:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fragments (document_id, pointer, content) "
+                "VALUES (?, ?, ?)",
+                (
+                    (cursor.lastrowid, pointer, json.dumps(definition))
+                    for pointer, definition in _iter_named_definitions(model, "")
+                ),
+            )
+
+    def get_documents(self, ns: NamespaceURI) -> Iterable[dict]:
+        cursor = self._conn.execute(
+            "SELECT content FROM documents WHERE namespace = ? "
+            "ORDER BY version DESC, id",
+            (ns,),
+        )
+        return (json.loads(content) for (content,) in cursor)
+
+    def get_document(self, ns: NamespaceURI, version: str) -> dict:
+        row = self._conn.execute(
+            "SELECT content FROM documents WHERE namespace = ? AND version = ? "
+            "ORDER BY id LIMIT 1",
+            (ns, version),
+        ).fetchone()
+        if row is None:
+            raise exceptions.DocumentNotFoundError(f"No version {version} of {ns}")
+        return json.loads(row[0])
+
+    def get_fragments(self, ns: NamespaceURI, path: str) -> Iterable[Fragment]:
+        if not self._index_fragments:
+            yield from super().get_fragments(ns, path)
+            return
+
+        rows = self._conn.execute(
+            "SELECT documents.id, fragments.content FROM fragments "
+            "JOIN documents ON documents.id = fragments.document_id "
+            "WHERE documents.namespace = ? AND fragments.pointer = ? "
+            "ORDER BY documents.version DESC, documents.id",
+            (ns, path.lstrip("#")),
+        ).fetchall()
+        if not rows:
+            # Not a named definition, fall back to walking the documents
+            yield from super().get_fragments(ns, path)
+            return
+
+        for document_id, content in rows:
+            yield Fragment(
+                json.loads(content),
+                functools.partial(self._load_document, document_id),
+            )
+
+    def _load_document(self, document_id: int) -> dict:
+        (content,) = self._conn.execute(
+            "SELECT content FROM documents WHERE id = ?", (document_id,)
+        ).fetchone()
+        return json.loads(content)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    version TEXT NOT NULL COLLATE sdf_version,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_namespace_version
+    ON documents (namespace, version);
+CREATE TABLE IF NOT EXISTS fragments (
+    document_id INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE,
+    pointer TEXT NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (document_id, pointer)
+);
+CREATE INDEX IF NOT EXISTS fragments_pointer ON fragments (pointer);
+"""
+
+
+class HTTPRegistry(Registry):
+    """A registry fetching documents from an HTTP model server
+
+    All documents contributing to a namespace are fetched in a single
+    GET request to the given URL with the namespace URI as the "namespace"
+    query parameter. The server must respond with a JSON array of documents,
+    or 404 if the namespace is unknown.
+
+    Responses are kept in memory for max_age seconds and are then revalidated
+    using ETag/If-None-Match. If a cache directory is given, responses are
+    also stored on disk so that they can be revalidated across restarts.
+    Connections are kept alive and reused between requests.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        url: str,
+        cache_dir: Path | str | None = None,
+        *,
+        max_age: float = 60.0,
+        max_connections: int = 4,
+        timeout: float | None = 10.0,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """
+        :param url: URL of the documents endpoint
+        :param cache_dir: Directory for storing responses on disk
+        :param max_age: Seconds before a response is revalidated
+        :param max_connections: Maximum number of idle connections to keep
+        :param timeout: Socket timeout in seconds
+        :param headers: Additional request headers, e.g. for authorization
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {url}")
+        self._connection_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = parts.netloc
+        self._path = parts.path or "/"
+        self._query = parts.query
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._max_age = max_age
+        self._timeout = timeout
+        self._headers = headers or {}
+        self._pool: queue.Queue[http.client.HTTPConnection] = queue.Queue(
+            max_connections
+        )
+        self._cache: dict[NamespaceURI, _HTTPCacheEntry] = {}
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def clear_cache(self) -> None:
+        """Forget all responses kept in memory
+
+        Responses stored on disk will be revalidated on next use.
+        """
+        self._cache.clear()
+
+    def get_documents(self, ns: NamespaceURI) -> Iterable[dict]:
+        entry = self._cache.get(ns)
+        now = time.monotonic()
+        if entry is not None and now - entry.fetched < self._max_age:
+            return entry.documents
+
+        if entry is None:
+            entry = self._load_cached(ns)
+        headers = dict(self._headers)
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+
+        query = urlencode({"namespace": ns})
+        if self._query:
+            query = f"{self._query}&{query}"
+        status, etag, body = self._request(f"{self._path}?{query}", headers)
+
+        if status == 304 and entry is not None:
+            entry = entry._replace(fetched=now)
+        elif status == 404:
+            entry = _HTTPCacheEntry(None, [], now)
+        elif status == 200:
+            documents = sorted(
+                json.loads(body), key=_get_version_key_from_model, reverse=True
+            )
+            entry = _HTTPCacheEntry(etag, documents, now)
+            self._store_cached(ns, entry)
+        else:
+            raise exceptions.RegistryError(f"Got HTTP status {status} for {ns}")
+
+        self._cache[ns] = entry
+        return entry.documents
+
+    def _request(
+        self, target: str, headers: dict[str, str]
+    ) -> tuple[int, str | None, bytes]:
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            try:
+                return self._send(conn, target, headers)
+            except (http.client.HTTPException, OSError):
+                # The idle connection may have been closed by the server,
+                # retry with a new connection
+                pass
+
+        conn = self._connection_class(self._host, timeout=self._timeout)
+        try:
+            return self._send(conn, target, headers)
+        except (http.client.HTTPException, OSError) as exc:
+            raise exceptions.RegistryError(
+                f"Request to {self._host} failed: {exc}"
+            ) from exc
+
+    def _send(
+        self, conn: http.client.HTTPConnection, target: str, headers: dict[str, str]
+    ) -> tuple[int, str | None, bytes]:
+        try:
+            conn.request("GET", target, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            # Keep the connection alive for the next request
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        return response.status, response.getheader("ETag"), body
+
+    def _cache_path(self, ns: NamespaceURI) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha256(ns.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+
+    def _load_cached(self, ns: NamespaceURI) -> "_HTTPCacheEntry | None":
+        path = self._cache_path(ns)
+        if path is None or not path.exists():
+            return None
+        with path.open("r", encoding="utf-8") as fp:
+            cached = json.load(fp)
+        # Always revalidate responses from disk
+        return _HTTPCacheEntry(cached["etag"], cached["documents"], float("-inf"))
+
+    def _store_cached(self, ns: NamespaceURI, entry: "_HTTPCacheEntry") -> None:
+        path = self._cache_path(ns)
+        if path is None or not entry.etag:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump({"etag": entry.etag, "documents": entry.documents}, fp)
+        os.replace(tmp_path, path)
+
+
+class _HTTPCacheEntry(NamedTuple):
+    etag: str | None
+    documents: list[dict]
+    fetched: float
+
+
+def get_by_pointer(model: dict, path: str) -> Definition:
+    """Get a definition from a document by a JSON pointer
+
+    :param model: The document
+    :param path: A JSON pointer, optionally prefixed with "#"
+    :raises KeyError: If the path does not exist in the document
+    :raises TypeError: If the path traverses a non-object value
+    """
+    definition: Definition = model
+    for segment in path.split("/")[1:]:
+        if not isinstance(definition, dict):
+            raise TypeError(f"{segment} in {path} is not an object")
+        definition = definition[segment]
+    return definition
+
+
+def _iter_named_definitions(
+    definition: Definition, path: str
+) -> Iterator[tuple[str, Definition]]:
+    for group in DEFINITION_GROUPS:
+        children = definition.get(group)
+        if not isinstance(children, dict):
+            continue
+        for name, child in children.items():
+            if isinstance(child, dict):
+                pointer = f"{path}/{group}/{name}"
+                yield pointer, child
+                yield from _iter_named_definitions(child, pointer)
+
+
+def _identity(model: dict) -> dict:
+    return model
+
+
+def version_key(version: str) -> VersionKey:
+    """Get a comparable key for a version string
+
+    Numeric parts are compared as integers, so e.g. "9" < "10" and
+    "1.2" < "1.10", while date versions like "2019-04-24" keep their order.
+    """
+    return tuple(
+        int(part) if i % 2 else part for i, part in enumerate(_DIGITS.split(version))
+    )
+
+
+_DIGITS = re.compile(r"(\d+)")
+
+
+def _compare_versions(a: str, b: str) -> int:
+    key_a, key_b = version_key(a), version_key(b)
+    return (key_a > key_b) - (key_a < key_b)
 
 
 def _get_version_from_model(model: dict) -> str:
     return model.get("info", {}).get("version", "")
+
+
+def _get_version_key_from_model(model: dict) -> VersionKey:
+    return version_key(_get_version_from_model(model))
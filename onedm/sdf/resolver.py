@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import NamedTuple
-from .registry import Registry, Definition, NullRegistry
-from . import exceptions
+from typing import Callable, NamedTuple
+from .registry import Registry, Definition, NullRegistry, get_by_pointer
+from . import exceptions, tracing
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,15 @@ class DerefResult(NamedTuple):
     """A resolver to use when resolving the definition"""
 
 
+class UnresolvedReference(NamedTuple):
+    """Global reference left in a resolved definition"""
+
+    pointer: str
+    """JSON pointer to the definition containing the sdfRef"""
+    ref: str
+    """The sdfRef value"""
+
+
 class Resolver:
     """SDF resolver
 
@@ -41,9 +50,40 @@ class Resolver:
         """
         return cls(document, NullRegistry())
 
-    def __init__(self, document: dict, registry: Registry):
-        self._document = document
+    def __init__(self, document: dict | Callable[[], dict], registry: Registry):
+        """
+        :param document: The document to dereference local pointers in, or a
+                         callable loading it on first use
+        :param registry: Registry for dereferencing global URIs
+        """
+        self._document_or_loader = document
         self._registry = registry
+        self._dereferenced: list[tuple[str, str]] = []
+        # Ordered set, as merging may resolve a definition more than once
+        self._unresolved: dict[UnresolvedReference, None] = {}
+
+    @property
+    def _document(self) -> dict:
+        if callable(self._document_or_loader):
+            self._document_or_loader = self._document_or_loader()
+        return self._document_or_loader
+
+    @property
+    def dereferenced(self) -> list[tuple[str, str]]:
+        """Global URIs dereferenced so far as (namespace, path) tuples
+
+        Includes references that could not be dereferenced.
+        """
+        return self._dereferenced
+
+    @property
+    def unresolved(self) -> list[UnresolvedReference]:
+        """Global references that could not be dereferenced so far
+
+        Each reference is recorded with its location in the resolved output,
+        so all remaining sdfRefs are found without traversing the result.
+        """
+        return list(self._unresolved)
 
     def deref(self, uri: str) -> DerefResult:
         """Dereference URI
@@ -57,10 +97,12 @@ class Resolver:
         ns, path = uri.split("#", maxsplit=1)
         return self._deref_ns_and_path(ns, path)
 
-    def resolve(self, definition: Definition) -> Definition:
+    def resolve(self, definition: Definition, pointer: str = "#") -> Definition:
         """Resolve a single definition
 
         :param definition: A definition to be resolved
+        :param pointer: JSON pointer to the definition, used when recording
+                        unresolved references
         :returns: A resolved copy
         """
         ref: str | None = definition.get("sdfRef")
@@ -72,11 +114,12 @@ class Resolver:
                 # intentional, so leave the sdfRef and let the user handle
                 # remaining references in the document.
                 logger.warning("%s", exc)
+                self._unresolved[UnresolvedReference(pointer, ref)] = None
                 original = {}
                 patch = definition
             else:
                 # Resolve the referenced definition
-                original = resolver.resolve(unresolved_original)
+                original = resolver.resolve(unresolved_original, pointer)
                 # Remove the sdfRef key from the patch
                 patch = definition.copy()
                 del patch["sdfRef"]
@@ -90,7 +133,12 @@ class Resolver:
             # Pure reference, nothing to patch
             return original
 
-        self._merge(original, patch)
+        if original:
+            # Patching a referenced definition
+            with tracing.span("sdf.merge", pointer=pointer):
+                self._merge(original, patch, pointer)
+        else:
+            self._merge(original, patch, pointer)
         return original
 
     def _dereference_internal(self, ref: str) -> DerefResult:
@@ -106,36 +154,47 @@ class Resolver:
         return self._deref_ns_and_path(ns, path)
 
     def _deref_ns_and_path(self, ns: str, path: str) -> DerefResult:
-        models = self._registry.get_documents(ns) if ns else [self._document]
+        with tracing.span("sdf.deref", ns=ns, path=path, hit=False) as span:
+            result = self._find_definition(ns, path)
+            span.set("hit", True)
+            return result
 
-        # Go through the models that may contain a matching path
-        for model in models:
-            # Start at the root of the model
-            definition: Definition = model
+    def _find_definition(self, ns: str, path: str) -> DerefResult:
+        if not ns:
             try:
-                for segment in path.split("/")[1:]:
-                    if not isinstance(definition, dict):
-                        raise TypeError(f"{segment} in {ns}#{path} is not an object")
-                    definition = definition[segment]
-                return DerefResult(definition, Resolver(model, self._registry))
-            except KeyError:
-                pass
-
-        if ns:
-            raise exceptions.UnresolvableReferenceError(f"Could not find {ns}{path}")
-        raise exceptions.InvalidLocalReferenceError(f"Could not find {path}")
-
-    def _merge(self, original: dict, patch: dict) -> None:
+                definition = get_by_pointer(self._document, path)
+            except KeyError as exc:
+                raise exceptions.InvalidLocalReferenceError(
+                    f"Could not find {path}"
+                ) from exc
+            return DerefResult(definition, self)
+
+        self._dereferenced.append((ns, path))
+        # Use the first (latest) matching definition in the namespace
+        for fragment in self._registry.get_fragments(ns, path):
+            resolver = Resolver(fragment.load_document, self._registry)
+            # Share the record of dereferenced URIs with the new resolver
+            # pylint: disable-next=protected-access
+            resolver._dereferenced = self._dereferenced
+            # pylint: disable-next=protected-access
+            resolver._unresolved = self._unresolved
+            tracing.count("sdf.registry_lookups", ns=ns, hit=True)
+            return DerefResult(fragment.definition, resolver)
+
+        tracing.count("sdf.registry_lookups", ns=ns, hit=False)
+        raise exceptions.UnresolvableReferenceError(f"Could not find {ns}{path}")
+
+    def _merge(self, original: dict, patch: dict, pointer: str) -> None:
         # Recursive merge patch
         for name, value in patch.items():
             if isinstance(value, dict):
                 # Resolve the patch value first
-                value = self.resolve(value)
+                value = self.resolve(value, f"{pointer}/{name}")
                 # Obtain the target dictionary (if any)
                 target = original.get(name)
                 if isinstance(target, dict):
                     # Merge the two dictionaries
-                    self._merge(target, value)
+                    self._merge(target, value, f"{pointer}/{name}")
                 else:
                     # Added or replaced
                     original[name] = value
@@ -0,0 +1,190 @@
+"""Live property state of Thing and Object instances"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Mapping, NamedTuple
+
+from . import definitions, exceptions
+
+ChangeCallback = Callable[[str, str, Any, Any], None]
+"""Called with instance id, property pointer, old value, and new value"""
+
+# Marks properties without a value
+_UNSET: Any = object()
+
+
+class _Slot(NamedTuple):
+    position: int
+    pointer: str
+    definition: definitions.Property
+    readable: bool
+    writable: bool
+    observable: bool
+
+
+class StateStore:
+    """Property values of many instances of the same Thing or Object
+
+    Properties are identified by JSON pointers relative to the definition,
+    e.g. "#/sdfObject/Switch/sdfProperty/on" for a Thing or "#/sdfProperty/on"
+    for an Object. Values are validated with validators built once per
+    property and shared by all instances. Each instance stores its values in
+    a list indexed by property rather than a dict.
+
+    Subscribers are notified when an observable property changes value.
+    """
+
+    def __init__(self, definition: definitions.Thing | definitions.Object) -> None:
+        self._slots: dict[str, _Slot] = {}
+        self._add_properties(definition, "#")
+        self._validators: list[Callable[[Any], Any] | None] = [None] * len(self._slots)
+        self._instances: dict[str, list[Any]] = {}
+        self._callbacks: list[ChangeCallback] = []
+
+    @property
+    def pointers(self) -> list[str]:
+        """Pointers to all properties"""
+        return list(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __contains__(self, instance_id: str) -> bool:
+        return instance_id in self._instances
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._instances)
+
+    def add_instance(
+        self, instance_id: str, values: Mapping[str, Any] | None = None
+    ) -> None:
+        """Add an instance with default or given property values
+
+        Initial values are validated but not checked for writability and
+        do not cause notifications.
+        """
+        if instance_id in self._instances:
+            raise ValueError(f"Instance {instance_id} already exists")
+        state = [
+            slot.definition.default if slot.definition.default is not None else _UNSET
+            for slot in self._slots.values()
+        ]
+        for slot, value in self._validate(values or {}, check_writable=False):
+            state[slot.position] = value
+        self._instances[instance_id] = state
+
+    def remove_instance(self, instance_id: str) -> None:
+        del self._instances[instance_id]
+
+    def read(self, instance_id: str, pointer: str, check_readable: bool = True) -> Any:
+        """Read a property value, None if it has no value
+
+        :raises KeyError: Unknown instance or property
+        :raises PropertyAccessError: Property is not readable
+        """
+        slot = self._slots[pointer]
+        if check_readable and not slot.readable:
+            raise exceptions.PropertyAccessError(f"{pointer} is not readable")
+        value = self._instances[instance_id][slot.position]
+        return None if value is _UNSET else value
+
+    def snapshot(self, instance_id: str, check_readable: bool = True) -> dict[str, Any]:
+        """Get all property values of an instance by pointer
+
+        Properties without values, or that are not readable, are left out.
+        """
+        state = self._instances[instance_id]
+        return {
+            pointer: state[slot.position]
+            for pointer, slot in self._slots.items()
+            if state[slot.position] is not _UNSET
+            and (slot.readable or not check_readable)
+        }
+
+    def write(
+        self, instance_id: str, pointer: str, value: Any, check_writable: bool = True
+    ) -> bool:
+        """Validate and write a property value
+
+        :param check_writable: Reject writes to properties that are not
+                               writable, disable for values reported by the
+                               device itself
+        :returns: True if the value changed
+        :raises KeyError: Unknown instance or property
+        :raises PropertyAccessError: Property is not writable
+        :raises pydantic.ValidationError: Invalid value
+        """
+        return bool(self.update(instance_id, {pointer: value}, check_writable))
+
+    def update(
+        self,
+        instance_id: str,
+        values: Mapping[str, Any],
+        check_writable: bool = True,
+    ) -> dict[str, Any]:
+        """Validate and write many property values
+
+        Either all or none of the values are written. Subscribers are notified
+        after all values are written.
+
+        :returns: Changed values by pointer
+        """
+        state = self._instances[instance_id]
+        changed = {}
+        notifications = []
+        for slot, value in self._validate(values, check_writable):
+            old = state[slot.position]
+            if old is not _UNSET and old == value:
+                continue
+            state[slot.position] = value
+            changed[slot.pointer] = value
+            if slot.observable:
+                notifications.append(
+                    (slot.pointer, None if old is _UNSET else old, value)
+                )
+        for pointer, old, value in notifications:
+            for callback in list(self._callbacks):
+                callback(instance_id, pointer, old, value)
+        return changed
+
+    def subscribe(self, callback: ChangeCallback) -> Callable[[], None]:
+        """Get notified when observable properties change
+
+        :returns: A function removing the subscription
+        """
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    def _validate(
+        self, values: Mapping[str, Any], check_writable: bool
+    ) -> list[tuple[_Slot, Any]]:
+        validated = []
+        for pointer, value in values.items():
+            slot = self._slots[pointer]
+            if check_writable and not slot.writable:
+                raise exceptions.PropertyAccessError(f"{pointer} is not writable")
+            validator = self._validators[slot.position]
+            if validator is None:
+                validator = slot.definition.get_validator()
+                self._validators[slot.position] = validator
+            validated.append((slot, validator(value)))
+        return validated
+
+    def _add_properties(
+        self, definition: definitions.Thing | definitions.Object, path: str
+    ) -> None:
+        if isinstance(definition, definitions.Thing):
+            for name, thing in definition.things.items():
+                self._add_properties(thing, f"{path}/sdfThing/{name}")
+            for name, obj in definition.objects.items():
+                self._add_properties(obj, f"{path}/sdfObject/{name}")
+        for name, prop in definition.properties.items():
+            pointer = f"{path}/sdfProperty/{name}"
+            self._slots[pointer] = _Slot(
+                len(self._slots),
+                pointer,
+                prop,
+                prop.readable,
+                prop.writable,
+                prop.observable,
+            )
@@ -0,0 +1,221 @@
+"""Opt-in instrumentation of loading, resolving, and validation
+
+Install a Tracer to receive spans and counters, e.g. to export them to a
+metrics or tracing system:
+
+    tracer = RecordingTracer()
+    with use_tracer(tracer):
+        loader.to_sdf()
+    for span in tracer.spans:
+        print(span.name, span.duration, span.attributes)
+
+Only one tracer is installed at a time. Use MultiTracer to install several.
+
+When no tracer is installed, instrumented code only pays for a function call.
+
+Spans:
+
+sdf.parse
+    Parsing a JSON document. Attributes: size.
+sdf.deref
+    Dereferencing a reference. Attributes: ns (empty for local references),
+    path, and hit (whether a definition was found).
+sdf.merge
+    Merging a patch into a referenced definition. Attributes: pointer.
+sdf.validate_model
+    Validating a document with Pydantic. Attributes: model, json.
+sdf.validate_value
+    Validating a value with DataQualities.validate_input. Attributes: type
+    and definition (the DataQualities instance).
+sdf.validate_batch
+    Validating many values with the same definition. Attributes: type,
+    definition, size (number of values), and errors (validation errors of the
+    invalid values).
+
+Counters:
+
+sdf.registry_lookups
+    Global references looked up in a registry. Attributes: ns and hit.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import time
+from typing import Any, Iterator, NamedTuple
+
+
+class Tracer:
+    """Receives spans and counters
+
+    Override the methods of interest. All methods are called synchronously
+    from the instrumented code and should be fast.
+    """
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Any:
+        """A span has started
+
+        :param name: Name of the operation
+        :param attributes: Attributes known when starting, more may be added
+                           before the span ends
+        :returns: Any object, which is passed to end_span()
+        """
+
+    def end_span(
+        self,
+        name: str,
+        token: Any,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        """A span has ended
+
+        :param name: Name of the operation
+        :param token: Return value from start_span()
+        :param attributes: All attributes of the span
+        :param error: Exception raised by the operation, if any
+        """
+
+    def count(self, name: str, value: int, attributes: dict[str, Any]) -> None:
+        """A counter has been incremented"""
+
+
+class SpanRecord(NamedTuple):
+    """Span recorded by RecordingTracer"""
+
+    name: str
+    attributes: dict[str, Any]
+    duration: float
+    """Duration in seconds"""
+    error: BaseException | None
+
+
+class RecordingTracer(Tracer):
+    """Tracer keeping all spans and counters in memory"""
+
+    def __init__(self) -> None:
+        self.spans: list[SpanRecord] = []
+        self.counters: dict[str, int] = {}
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> float:
+        return time.perf_counter()
+
+    def end_span(
+        self,
+        name: str,
+        token: float,
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        duration = time.perf_counter() - token
+        self.spans.append(SpanRecord(name, attributes, duration, error))
+
+    def count(self, name: str, value: int, attributes: dict[str, Any]) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+class MultiTracer(Tracer):
+    """Tracer passing spans and counters on to several tracers
+
+    Use it to install e.g. an exporting tracer and metrics at the same time:
+
+        with use_tracer(MultiTracer(exporter, ValidationMetrics(document))):
+            ...
+    """
+
+    def __init__(self, *tracers: Tracer) -> None:
+        self.tracers = tracers
+
+    def start_span(self, name: str, attributes: dict[str, Any]) -> list[Any]:
+        return [tracer.start_span(name, attributes) for tracer in self.tracers]
+
+    def end_span(
+        self,
+        name: str,
+        token: list[Any],
+        attributes: dict[str, Any],
+        error: BaseException | None,
+    ) -> None:
+        for tracer, tracer_token in zip(self.tracers, token):
+            tracer.end_span(name, tracer_token, attributes, error)
+
+    def count(self, name: str, value: int, attributes: dict[str, Any]) -> None:
+        for tracer in self.tracers:
+            tracer.count(name, value, attributes)
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_attributes", "_token")
+
+    def __init__(self, tracer: Tracer, name: str, attributes: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._token = None
+
+    def __enter__(self) -> _Span:
+        self._token = self._tracer.start_span(self._name, self._attributes)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._tracer.end_span(self._name, self._token, self._attributes, exc)
+
+    def set(self, name: str, value: Any) -> None:
+        """Add an attribute to the span"""
+        self._attributes[name] = value
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        pass
+
+    def set(self, name: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+_tracer: Tracer | None = None  # pylint: disable=invalid-name
+
+
+def get_tracer() -> Tracer | None:
+    """Get the installed tracer, if any"""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Install a tracer for the whole process, or None to disable tracing"""
+    global _tracer  # pylint: disable=global-statement
+    _tracer = tracer
+
+
+@contextmanager
+def use_tracer(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Install a tracer temporarily"""
+    previous = _tracer
+    set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+
+
+def span(name: str, **attributes: Any) -> _Span | _NullSpan:
+    """Measure an operation using the installed tracer
+
+    Use as a context manager. Attributes can be added with set().
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, attributes)
+
+
+def count(name: str, value: int = 1, **attributes: Any) -> None:
+    """Increment a counter using the installed tracer"""
+    if _tracer is not None:
+        _tracer.count(name, value, attributes)
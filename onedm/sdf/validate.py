@@ -1,14 +1,44 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import glob
 import json
 from pathlib import Path
-from typing import Any
+import sys
+import time
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from pydantic import ValidationError
+
 from onedm import sdf
+from onedm.sdf import exceptions
+
+
+class FileResult(NamedTuple):
+    """Result of validating a single file"""
+
+    path: Path
+    time: float
+    """Time spent validating the file in seconds"""
+    errors: list[dict[str, Any]]
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "valid": self.valid,
+            "time": self.time,
+            "errors": self.errors,
+        }
 
 
 def validate_doc(document: dict, registry: sdf.Registry, check_refs: bool = False):
     resolver = sdf.Resolver(document, registry)
     resolved = resolver.resolve(document)
-    if check_refs:
-        check_for_refs(resolved, "#")
+    if check_refs and resolver.unresolved:
+        raise exceptions.UnresolvedReferencesError(resolver.unresolved)
     sdf.Document.model_validate(resolved)
 
 
@@ -23,21 +53,102 @@ def validate_file(path: Path, models: Path | None = None, check_refs: bool = Fal
     validate_doc(document, registry, check_refs)
 
 
-def check_for_refs(definition: dict[str, Any], path: str):
-    assert (
-        "sdfRef" not in definition
-    ), f"Unresolved sdfRef {definition['sdfRef']} found in {path}"
+def validate_files(
+    paths: Iterable[Path],
+    registry: sdf.Registry,
+    check_refs: bool = False,
+    jobs: int | None = 1,
+) -> Iterator[FileResult]:
+    """Validate many files using the same registry
 
-    for name, child in definition.items():
-        if isinstance(child, dict):
-            check_for_refs(child, path + "/" + name)
+    :param paths: Files to validate
+    :param registry: Registry for global references, must be picklable if
+                     more than one job is used
+    :param check_refs: Check that all references could be resolved
+    :param jobs: Number of worker processes, None to use all CPUs
+    :returns: Results in the same order as the paths
+    """
+    if jobs == 1:
+        for path in paths:
+            yield _validate_path(path, registry, check_refs)
+        return
 
+    with ProcessPoolExecutor(
+        jobs, initializer=_init_worker, initargs=(registry, check_refs)
+    ) as executor:
+        yield from executor.map(_validate_in_worker, paths, chunksize=8)
+
+
+def find_files(patterns: Iterable[str]) -> list[Path]:
+    """Expand directories and glob patterns to SDF files
+
+    Directories are recursively scanned for files with .sdf.json extension.
+    """
+    paths: dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(path.rglob("*.sdf.json"))
+        elif glob.has_magic(pattern):
+            matches = [
+                Path(match) for match in sorted(glob.glob(pattern, recursive=True))
+            ]
+        else:
+            matches = [path]
+        paths.update(dict.fromkeys(matches))
+    return list(paths)
+
+
+def _validate_path(path: Path, registry: sdf.Registry, check_refs: bool) -> FileResult:
+    start = time.perf_counter()
+    try:
+        with path.open("rb") as fp:
+            document = json.load(fp)
+        validate_doc(document, registry, check_refs)
+    except ValidationError as exc:
+        errors = [
+            {
+                "type": error["type"],
+                "loc": ".".join(str(part) for part in error["loc"]),
+                "msg": error["msg"],
+            }
+            for error in exc.errors(include_url=False)
+        ]
+    except exceptions.UnresolvedReferencesError as exc:
+        errors = [
+            {
+                "type": "unresolved_reference",
+                "loc": pointer,
+                "msg": f"Unresolved sdfRef {ref}",
+            }
+            for pointer, ref in exc.unresolved
+        ]
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        # Any other failure only invalidates this file, not the whole batch
+        errors = [{"type": type(exc).__name__, "loc": "", "msg": str(exc)}]
+    else:
+        errors = []
+    return FileResult(path, time.perf_counter() - start, errors)
+
+
+# Registry and options in worker processes
+_worker_args: tuple[sdf.Registry, bool] = (sdf.registry.NullRegistry(), False)
+
+
+def _init_worker(registry: sdf.Registry, check_refs: bool) -> None:
+    global _worker_args  # pylint: disable=global-statement
+    _worker_args = (registry, check_refs)
 
-if __name__ == "__main__":
-    import argparse
 
-    parser = argparse.ArgumentParser(description="Validate an SDF document")
-    parser.add_argument("filename", type=Path)
+def _validate_in_worker(path: Path) -> FileResult:
+    return _validate_path(path, *_worker_args)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate SDF documents")
+    parser.add_argument(
+        "filenames", nargs="+", help="Files, directories, or glob patterns"
+    )
     parser.add_argument("--models", type=Path, help="Directory with global models")
     parser.add_argument(
         "--check-refs",
@@ -45,6 +156,49 @@ if __name__ == "__main__":
         default=False,
         help="Check that all references could be resolved",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes, 0 to use all CPUs",
+    )
+    parser.add_argument(
+        "--report", type=Path, help="Write a JSON report to this file, - for stdout"
+    )
 
-    args = parser.parse_args()
-    validate_file(args.filename, args.models, args.check_refs)
+    args = parser.parse_args(argv)
+    registry = (
+        sdf.registry.FileBasedRegistry(args.models)
+        if args.models
+        else sdf.registry.NullRegistry()
+    )
+    paths = find_files(args.filenames)
+
+    start = time.perf_counter()
+    results = []
+    for result in validate_files(paths, registry, args.check_refs, args.jobs or None):
+        results.append(result)
+        for error in result.errors:
+            location = f"{result.path}: {error['loc']}" if error["loc"] else result.path
+            print(f"{location}: {error['msg']}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    if args.report:
+        report = {
+            "files": [result.to_json() for result in results],
+            "valid": sum(result.valid for result in results),
+            "invalid": sum(not result.valid for result in results),
+            "time": elapsed,
+        }
+        if str(args.report) == "-":
+            json.dump(report, sys.stdout, indent=2)
+        else:
+            with args.report.open("w") as fp:
+                json.dump(report, fp, indent=2)
+
+    return 0 if all(result.valid for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Callable
+
 import pytest
 
 from onedm import sdf
@@ -9,3 +11,32 @@ def test_model():
     loader = sdf.SDFLoader()
     loader.load_file(Path(__file__).parent / "test.sdf.json")
     return loader.to_sdf()
+
+
+@pytest.fixture
+def make_model() -> Callable[..., dict]:
+    """Factory for versions of a model in the example namespace"""
+
+    def make(version: str, maximum: int = 1) -> dict:
+        return {
+            "info": {"version": version},
+            "namespace": {"example": "https://example.com/example"},
+            "defaultNamespace": "example",
+            "sdfObject": {
+                "Example": {
+                    "sdfProperty": {
+                        "Level": {
+                            "sdfRef": "#/sdfData/Level",
+                        }
+                    }
+                }
+            },
+            "sdfData": {
+                "Level": {
+                    "type": "integer",
+                    "maximum": maximum,
+                }
+            },
+        }
+
+    return make
@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+from onedm import sdf
+from onedm.sdf.cache import DocumentCache
+from onedm.sdf.registry import InMemoryRegistry
+
+
+TOP_LEVEL_DOC = {
+    "namespace": {"example": "https://example.com/example"},
+    "sdfProperty": {
+        "Level": {"sdfRef": "example:#/sdfData/Level"},
+        "Missing": {"sdfRef": "example:#/sdfData/Missing"},
+    },
+}
+
+
+def load(raw: bytes, registry: sdf.Registry, cache: DocumentCache) -> sdf.Document:
+    loader = sdf.SDFLoader(registry, cache=cache)
+    loader.load_bytes(raw)
+    return loader.to_sdf()
+
+
+def test_cache_hit(tmp_path: Path, monkeypatch, make_model):
+    registry = InMemoryRegistry()
+    registry.add_document(make_model("1", 1))
+    cache = DocumentCache(tmp_path)
+    raw = json.dumps(TOP_LEVEL_DOC).encode("utf-8")
+
+    first = load(raw, registry, cache)
+    assert first.properties["Level"].maximum == 1
+
+    # Resolving or validating again would fail
+    monkeypatch.setattr(sdf.Document, "model_validate", None)
+    second = load(raw, registry, cache)
+    assert second == first
+
+
+def test_cache_invalidated_by_registry(tmp_path: Path, make_model):
+    registry = InMemoryRegistry()
+    registry.add_document(make_model("1", 1))
+    cache = DocumentCache(tmp_path)
+    raw = json.dumps(TOP_LEVEL_DOC).encode("utf-8")
+
+    assert load(raw, registry, cache).properties["Level"].maximum == 1
+
+    registry.add_document(make_model("2", 2))
+    assert load(raw, registry, cache).properties["Level"].maximum == 2
+
+
+def test_cache_invalidated_by_source(tmp_path: Path):
+    cache = DocumentCache(tmp_path)
+    registry = sdf.registry.NullRegistry()
+
+    doc = load(b'{"info": {"title": "First"}}', registry, cache)
+    assert doc.info.title == "First"
+    doc = load(b'{"info": {"title": "Second"}}', registry, cache)
+    assert doc.info.title == "Second"
+
+    cache.clear()
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,161 @@
+import enum
+import types
+
+import pydantic
+import pytest
+
+from onedm import sdf
+from onedm.sdf.codegen import generate_module
+
+
+@pytest.fixture(scope="module")
+def module() -> types.ModuleType:
+    document = sdf.Document.model_validate(
+        {
+            "info": {"title": "Generated"},
+            "sdfThing": {
+                "Room": {
+                    "sdfObject": {
+                        "Light": {
+                            "sdfProperty": {
+                                "on": {"type": "boolean", "sdfRequired": [True]},
+                            },
+                        },
+                    },
+                },
+            },
+            "sdfObject": {
+                "Thermostat": {
+                    "description": "A thermostat",
+                    "sdfProperty": {
+                        "targetTemperature": {
+                            "type": "number",
+                            "minimum": 5,
+                            "maximum": 30,
+                            "nullable": False,
+                            "default": 21,
+                        },
+                        "mode": {
+                            "type": "integer",
+                            "nullable": False,
+                            "sdfChoice": {
+                                "OFF": {"const": 0},
+                                "HEAT": {"const": 1},
+                            },
+                        },
+                        "schedule": {
+                            "type": "array",
+                            "nullable": False,
+                            "items": {
+                                "type": "object",
+                                "nullable": False,
+                                "properties": {
+                                    "time": {"type": "string", "format": "time"},
+                                    "class": {"type": "string", "enum": ["a", "b"]},
+                                },
+                                "required": ["time"],
+                            },
+                        },
+                    },
+                },
+            },
+            "sdfData": {
+                "Level": {"type": "integer", "minimum": 0, "nullable": False},
+                "Point": {
+                    "type": "object",
+                    "properties": {"x": {"type": "number"}, "y": {"type": "number"}},
+                },
+            },
+        }
+    )
+    source = generate_module(document)
+    module = types.ModuleType("generated")
+    exec(compile(source, "generated.py", "exec"), module.__dict__)
+    return module
+
+
+def test_object(module):
+    thermostat = module.Thermostat.model_validate(
+        {"mode": 1, "schedule": [{"time": "06:00", "class": "a"}]}
+    )
+
+    assert module.Thermostat.__doc__ == "A thermostat"
+    assert thermostat.target_temperature == 21
+    assert thermostat.mode is module.ThermostatMode.HEAT
+    assert issubclass(module.ThermostatMode, enum.IntEnum)
+    assert thermostat.schedule[0].time.hour == 6
+    assert thermostat.schedule[0].class_ == "a"
+    assert thermostat.model_dump(by_alias=True)["schedule"][0]["class"] == "a"
+
+    with pytest.raises(pydantic.ValidationError):
+        module.Thermostat.model_validate({"targetTemperature": 31})
+
+
+def test_thing(module):
+    room = module.Room.model_validate({"Light": {"on": True}})
+
+    assert room.light.on is True
+    with pytest.raises(pydantic.ValidationError):
+        module.Room.model_validate({"Light": {}})
+
+
+def test_data(module):
+    assert pydantic.TypeAdapter(module.Level).validate_python(3) == 3
+    with pytest.raises(pydantic.ValidationError):
+        pydantic.TypeAdapter(module.Level).validate_python(-1)
+
+    point = module.Point(x=1, y=None)
+    assert point.x == 1
+
+
+def test_required_pointers_and_names():
+    document = sdf.Document.model_validate(
+        {
+            "info": {"title": 'Quoted """ title \\'},
+            "sdfThing": {
+                "House": {
+                    "sdfObject": {
+                        "Switch": {
+                            "sdfProperty": {
+                                "state": {"type": "boolean"},
+                                "fooBar": {"type": "integer"},
+                                "foo_bar": {"type": "string"},
+                            },
+                            "sdfRequired": [
+                                "#/sdfThing/House/sdfObject/Switch/sdfProperty/state"
+                            ],
+                        },
+                    },
+                    "sdfRequired": ["#/sdfThing/House/sdfObject/Switch"],
+                },
+            },
+        }
+    )
+    source = generate_module(document)
+    module = types.ModuleType("generated")
+    exec(compile(source, "generated.py", "exec"), module.__dict__)
+
+    assert module.__doc__.endswith('Source: Quoted """ title \\\n')
+    house = module.House.model_validate(
+        {"Switch": {"state": True, "fooBar": 1, "foo_bar": "a"}}
+    )
+    assert house.switch.foo_bar == 1
+    assert house.switch.foo_bar_2 == "a"
+    assert house.model_dump(by_alias=True)["Switch"]["foo_bar"] == "a"
+    with pytest.raises(pydantic.ValidationError):
+        module.House.model_validate({"Switch": {}})
+    with pytest.raises(pydantic.ValidationError):
+        module.House.model_validate({})
+
+
+def test_const_null_property():
+    document = sdf.Document.model_validate(
+        {"sdfObject": {"Empty": {"sdfProperty": {"nothing": {"const": None}}}}}
+    )
+    source = generate_module(document)
+    module = types.ModuleType("generated")
+    exec(compile(source, "generated.py", "exec"), module.__dict__)
+
+    assert module.Empty.model_validate({}).nothing is None
+    with pytest.raises(pydantic.ValidationError):
+        module.Empty.model_validate({"nothing": 1})
@@ -0,0 +1,71 @@
+import pickle
+
+import pytest
+
+from onedm import sdf
+from onedm.sdf.compact import CompactBuilder, CompactDefinition, compact_document
+
+
+def test_compact_document(test_model: sdf.Document):
+    compact = compact_document(test_model)
+
+    assert compact.info.title == test_model.info.title
+    integer = compact.properties["IntegerProperty"]
+    assert integer.model_class is sdf.IntegerProperty
+    assert integer.label == "Example integer"
+    assert integer.minimum == -2
+    # Not set, so the default is returned
+    assert integer.type == "integer"
+    assert integer.writable is True
+    assert integer.unit is None
+
+    assert compact.data["Object"].required == ("prop1",)
+    assert compact.data["Object"].properties["prop1"].type == "number"
+    assert compact.objects["TestObject"].events == {}
+    assert set(compact.objects["TestObject"].actions) == {"on", "off", "toggle"}
+
+    with pytest.raises(AttributeError):
+        compact.data["Integer"].unknown
+    with pytest.raises(AttributeError):
+        compact.data["Integer"].minimum = 0
+
+
+def test_only_set_qualities_are_kept():
+    compact = compact_document(
+        sdf.Document(data={"Integer": sdf.IntegerData(maximum=2)})
+    )
+    assert compact.data["Integer"].qualities() == {"maximum": 2}
+
+
+def test_identical_definitions_are_shared():
+    doc = sdf.Document(
+        properties={
+            "first": sdf.IntegerProperty(unit="Cel", maximum=100),
+            "second": sdf.IntegerProperty(unit="Cel", maximum=100),
+            "third": sdf.IntegerProperty(unit="Cel", maximum=True),
+            "fourth": sdf.NumberProperty(unit="Cel", maximum=100),
+        }
+    )
+    compact = compact_document(doc)
+
+    assert compact.properties["first"] is compact.properties["second"]
+    assert compact.properties["first"] is not compact.properties["third"]
+    assert compact.properties["first"] is not compact.properties["fourth"]
+    assert compact.properties["first"].unit is compact.properties["fourth"].unit
+
+
+def test_sharing_between_documents():
+    builder = CompactBuilder()
+    first = builder.compact(sdf.Document(data={"a": sdf.StringData(max_length=3)}))
+    second = builder.compact(sdf.Document(data={"b": sdf.StringData(max_length=3)}))
+
+    assert first.data["a"] is second.data["b"]
+
+
+def test_pickle(test_model: sdf.Document):
+    compact = compact_document(test_model)
+    copy = pickle.loads(pickle.dumps(compact))
+
+    assert isinstance(copy, CompactDefinition)
+    assert copy == compact
+    assert hash(copy) == hash(compact)
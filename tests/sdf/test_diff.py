@@ -0,0 +1,56 @@
+from onedm import sdf
+from onedm.sdf.diff import diff, diff_versions, hash_tree
+from onedm.sdf.registry import InMemoryRegistry
+
+
+def test_hash_independent_of_key_order():
+    first = {"a": 1, "b": {"c": [1, 2], "d": None}}
+    second = {"b": {"d": None, "c": [1, 2]}, "a": 1}
+
+    assert hash_tree(first).digest == hash_tree(second).digest
+    assert hash_tree({"a": 1}).digest != hash_tree({"a": 1.0}).digest
+    assert hash_tree({"a": 1}).digest != hash_tree({"a": True}).digest
+    assert hash_tree({"a": [1, 2]}).digest != hash_tree({"a": [2, 1]}).digest
+
+
+def test_diff(make_model):
+    old = make_model("1")
+    new = make_model("2", maximum=255)
+    example = new["sdfObject"]["Example"]
+    del example["sdfProperty"]["Level"]
+    example["sdfAction"] = {"toggle": {}}
+
+    result = diff(old, new)
+
+    assert result.added == ["#/sdfObject/Example/sdfAction"]
+    assert result.removed == ["#/sdfObject/Example/sdfProperty/Level"]
+    assert result.changed == ["#/info/version", "#/sdfData/Level/maximum"]
+    assert result.definitions() == [
+        "#/info",
+        "#/sdfData/Level",
+        "#/sdfObject/Example",
+        "#/sdfObject/Example/sdfProperty/Level",
+    ]
+
+
+def test_diff_identical(make_model):
+    tree = hash_tree(make_model("1"))
+    assert not diff(tree, make_model("1"))
+
+
+def test_diff_resolved_documents(make_model):
+    old = sdf.Document.model_validate(make_model("1"))
+    new = sdf.Document.model_validate(make_model("1"))
+    new.data["Added"] = sdf.IntegerData(maximum=1)
+
+    assert diff(old, new).added == ["#/sdfData/Added"]
+
+
+def test_diff_registry_versions(make_model):
+    registry = InMemoryRegistry()
+    for model in [make_model("1"), make_model("2", maximum=2)]:
+        model["sdfData"]["Unchanged"] = {"type": "string"}
+        registry.add_document(model)
+
+    result = diff_versions(registry, "https://example.com/example", "1", "2")
+    assert result.definitions() == ["#/info", "#/sdfData/Level"]
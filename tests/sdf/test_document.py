@@ -1,3 +1,6 @@
+import io
+import json
+
 from onedm import sdf
 
 
@@ -79,3 +82,37 @@ def test_document_generation():
 
     assert dump_witout_defaults == cleaned_doc
     assert dump_witout_unset == cleaned_doc
+
+
+def test_streaming_serialization(test_model: sdf.Document):
+    assert "".join(test_model.iter_json()) == test_model.to_json()
+    for indent in (None, 0):
+        assert "".join(test_model.iter_json(indent)) == test_model.model_dump_json(
+            indent=indent, exclude_unset=True, by_alias=True
+        )
+
+
+def test_streaming_serialization_to_file():
+    doc = sdf.Document.model_validate(
+        {
+            "info": {"title": "Växel"},
+            "sdfThing": {"switch": {"sdfThing": {"sub": {"label": "Sub"}}}},
+            "sdfData": {},
+            "extraQuality": [1, {"nested": None}],
+        }
+    )
+    fp = io.StringIO()
+    doc.write_json(fp)
+
+    assert fp.getvalue() == doc.to_json()
+    assert json.loads(fp.getvalue())["extraQuality"] == [1, {"nested": None}]
+
+
+def test_streaming_lazy_document(test_model: sdf.Document):
+    raw = test_model.model_dump(mode="json", exclude_unset=True, by_alias=True)
+    lazy = sdf.Document.model_validate_lazy(raw)
+    eager = sdf.Document.model_validate(raw)
+
+    assert "".join(lazy.iter_json(indent=4)) == eager.model_dump_json(
+        indent=4, exclude_unset=True, by_alias=True
+    )
@@ -2,11 +2,19 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 import enum
+import gc
+import weakref
 from pydantic import Field, BaseModel, PlainSerializer
+import pytest
 from typing import Annotated, Literal
 
 from onedm import sdf
-from onedm.sdf.from_type import data_from_type, unresolved_data_from_type
+from onedm.sdf import from_type
+from onedm.sdf.from_type import (
+    data_from_type,
+    document_from_types,
+    unresolved_data_from_type,
+)
 
 
 def test_integer():
@@ -256,3 +264,74 @@ def test_unit():
     data = data_from_type(Annotated[float, Field(json_schema_extra={"unit": "s"})])
 
     assert data.unit == "s"
+
+
+def test_cache():
+    class Model(BaseModel):
+        value: int
+
+    from_type.clear_cache()
+    first = data_from_type(Model)
+    first.label = "Changed"
+    second = data_from_type(Model)
+    unresolved_data_from_type(Model)
+    unresolved = unresolved_data_from_type(Model)
+    unresolved_data_from_type(Model, ref_template="#/sdfData/Other/{model}")
+    data_from_type(int | None)
+    data_from_type(Annotated[int, Field(ge=0)], cache=False)
+
+    assert second.label == "Model"
+    assert second == data_from_type(Model, cache=False)
+    assert unresolved == unresolved_data_from_type(Model, cache=False)
+    assert from_type.cache_info() == from_type.CacheInfo(hits=2, misses=4, size=4)
+
+    model_ref = weakref.ref(Model)
+    del Model
+    gc.collect()
+    assert model_ref() is None
+    assert from_type.cache_info().size == 1
+
+
+def test_document_from_types():
+    class Unit(enum.IntEnum):
+        CELSIUS = 1
+        FAHRENHEIT = 2
+
+    class Temperature(BaseModel):
+        value: float
+        unit: Unit
+
+    class Room(BaseModel):
+        temperature: Temperature
+
+    class Building(BaseModel):
+        rooms: list[Room]
+        outside: Temperature
+
+    document = document_from_types([Room, Building], info={"title": "Buildings"})
+
+    assert document.info.title == "Buildings"
+    assert list(document.data) == ["Building", "Room", "Temperature", "Unit"]
+    assert (
+        document.data["Room"].properties["temperature"].ref == "#/sdfData/Temperature"
+    )
+    assert (
+        document.data["Building"].properties["outside"].ref == "#/sdfData/Temperature"
+    )
+    assert "$ref" not in document.data["Room"].properties["temperature"].model_extra
+    assert document.data["Unit"].choices["CELSIUS"].const == 1
+
+    document = document_from_types({"Count": int, "Rooms": list[Room]})
+
+    assert isinstance(document.data["Count"], sdf.IntegerData)
+    assert document.data["Rooms"].items.ref == "#/sdfData/Room"
+
+    with pytest.raises(ValueError):
+        document_from_types({"Temperature": int, "Room": Room})
+
+    class Other(BaseModel):
+        pass
+
+    Other.__name__ = "Room"
+    with pytest.raises(ValueError):
+        document_from_types([Room, Other])
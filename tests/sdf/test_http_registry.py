@@ -0,0 +1,159 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from onedm import sdf
+from onedm.sdf.exceptions import RegistryError
+from onedm.sdf.registry import HTTPRegistry
+
+
+NAMESPACE = "https://example.com/example"
+
+DOCUMENTS = [
+    {
+        "info": {"version": "1"},
+        "namespace": {"example": NAMESPACE},
+        "defaultNamespace": "example",
+        "sdfData": {"Level": {"type": "integer", "maximum": 1}},
+    },
+    {
+        "info": {"version": "2"},
+        "namespace": {"example": NAMESPACE},
+        "defaultNamespace": "example",
+        "sdfData": {"Level": {"type": "integer", "maximum": 2}},
+    },
+]
+
+
+class ModelServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ModelRequestHandler)
+        self.requests: list[tuple[str, str | None]] = []
+        self.clients: set[tuple[str, int]] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/documents"
+
+
+class ModelRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: ModelServer
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        ns = parse_qs(url.query)["namespace"][0]
+        self.server.requests.append((ns, self.headers.get("If-None-Match")))
+        self.server.clients.add(self.client_address)
+
+        if url.path != "/documents" or ns != NAMESPACE:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == '"v2"':
+            self.send_response(304)
+            self.send_header("ETag", '"v2"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps(DOCUMENTS).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v2"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ModelServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_documents(server: ModelServer):
+    registry = HTTPRegistry(server.url)
+
+    documents = list(registry.get_documents(NAMESPACE))
+    assert [doc["info"]["version"] for doc in documents] == ["2", "1"]
+    assert not list(registry.get_documents("https://example.com/other"))
+
+    # Served from memory
+    registry.get_documents(NAMESPACE)
+    assert len(server.requests) == 2
+    registry.close()
+
+
+def test_resolve(server: ModelServer):
+    top_level_doc = {
+        "namespace": {"example": NAMESPACE},
+        "sdfProperty": {
+            "Level1": {"sdfRef": "example:#/sdfData/Level"},
+            "Level2": {"sdfRef": "example:#/sdfData/Level"},
+        },
+    }
+
+    registry = HTTPRegistry(server.url)
+    resolver = sdf.Resolver(top_level_doc, registry)
+    doc = sdf.Document.model_validate(resolver.resolve(top_level_doc))
+
+    assert doc.properties["Level1"].maximum == 2
+    assert doc.properties["Level2"].maximum == 2
+    assert len(server.requests) == 1
+    registry.close()
+
+
+def test_revalidation_and_keep_alive(server: ModelServer):
+    registry = HTTPRegistry(server.url, max_age=0)
+
+    for _ in range(3):
+        documents = list(registry.get_documents(NAMESPACE))
+        assert documents[0]["info"]["version"] == "2"
+
+    assert server.requests == [
+        (NAMESPACE, None),
+        (NAMESPACE, '"v2"'),
+        (NAMESPACE, '"v2"'),
+    ]
+    # The same connection was used for all requests
+    assert len(server.clients) == 1
+    registry.close()
+
+
+def test_disk_cache(server: ModelServer, tmp_path: Path):
+    registry = HTTPRegistry(server.url, cache_dir=tmp_path)
+    registry.get_documents(NAMESPACE)
+    registry.close()
+
+    registry = HTTPRegistry(server.url, cache_dir=tmp_path)
+    documents = list(registry.get_documents(NAMESPACE))
+    assert documents[0]["info"]["version"] == "2"
+    assert server.requests[-1] == (NAMESPACE, '"v2"')
+    registry.close()
+
+
+def test_connection_error():
+    server = ModelServer()
+    url = server.url
+    server.server_close()
+
+    registry = HTTPRegistry(url)
+    with pytest.raises(RegistryError):
+        registry.get_documents(NAMESPACE)
@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+
+
+def run_in_fresh_interpreter(code: str):
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_defers_schema_building():
+    result = run_in_fresh_interpreter(
+        "import json, sys\n"
+        "from onedm import sdf\n"
+        "print(json.dumps({\n"
+        "    'complete': [\n"
+        "        cls.__name__ for cls in (sdf.Document, sdf.Thing, sdf.IntegerData)\n"
+        "        if cls.__pydantic_complete__\n"
+        "    ],\n"
+        "    'modules': [\n"
+        "        name for name in ('onedm.sdf.loader', 'onedm.sdf.registry')\n"
+        "        if name in sys.modules\n"
+        "    ],\n"
+        "}))\n"
+    )
+    assert result == {"complete": [], "modules": []}
+
+
+def test_lazy_attributes():
+    result = run_in_fresh_interpreter(
+        "import json\n"
+        "from onedm import sdf\n"
+        "print(json.dumps([\n"
+        "    sdf.SDFLoader.__name__,\n"
+        "    sdf.registry.FileBasedRegistry.__name__,\n"
+        "    sdf.IntegerData(maximum=2).validate_input('2'),\n"
+        "]))\n"
+    )
+    assert result == ["SDFLoader", "FileBasedRegistry", 2]
+
+
+def test_lazy_submodules():
+    result = run_in_fresh_interpreter(
+        "import json, pkgutil\n"
+        "from onedm import sdf\n"
+        "print(json.dumps([\n"
+        "    module.name for module in pkgutil.iter_modules(sdf.__path__)\n"
+        "    if not hasattr(sdf, module.name)\n"
+        "]))\n"
+    )
+    assert result == []
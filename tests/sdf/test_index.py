@@ -0,0 +1,94 @@
+from onedm import sdf
+
+
+def make_document() -> sdf.Document:
+    return sdf.Document.model_validate(
+        {
+            "sdfThing": {
+                "Room": {
+                    "sdfObject": {
+                        "Thermostat": {
+                            "sdfProperty": {
+                                "temperature": {
+                                    "type": "number",
+                                    "unit": "Cel",
+                                    "label": "Temperature",
+                                },
+                                "mode": {"type": "integer"},
+                            },
+                            "sdfAction": {"reset": {"label": "Reset"}},
+                        }
+                    },
+                    "sdfThing": {
+                        "Sensor": {
+                            "sdfProperty": {
+                                "temperature": {"type": "number", "unit": "Cel"},
+                                "timestamp": {
+                                    "type": "number",
+                                    "sdfType": "unix-time",
+                                },
+                            }
+                        }
+                    },
+                }
+            },
+            "sdfProperty": {"humidity": {"type": "number", "unit": "%RH"}},
+            "sdfData": {"Level": {"type": "integer", "unit": "%"}},
+        }
+    )
+
+
+def test_lookup_by_pointer():
+    doc = make_document()
+
+    pointer = "#/sdfThing/Room/sdfObject/Thermostat/sdfProperty/temperature"
+    assert pointer in doc.index
+    assert doc.index[pointer].label == "Temperature"
+    assert doc.index.get("#/sdfObject/Missing") is None
+    assert len(doc.index) == 10
+
+
+def test_find():
+    doc = make_document()
+
+    assert list(doc.index.find(unit="Cel")) == [
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfProperty/temperature",
+        "#/sdfThing/Room/sdfThing/Sensor/sdfProperty/temperature",
+    ]
+    assert list(doc.index.find(kind="sdfProperty", type="integer")) == [
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfProperty/mode",
+    ]
+    assert list(doc.index.find(type="integer")) == [
+        "#/sdfData/Level",
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfProperty/mode",
+    ]
+    assert list(doc.index.find(sdf_type="unix-time")) == [
+        "#/sdfThing/Room/sdfThing/Sensor/sdfProperty/timestamp",
+    ]
+    assert list(doc.index.find(label="Reset")) == [
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfAction/reset",
+    ]
+    assert list(doc.index.find(under="#/sdfThing/Room/sdfObject/Thermostat")) == [
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfAction/reset",
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfProperty/mode",
+        "#/sdfThing/Room/sdfObject/Thermostat/sdfProperty/temperature",
+    ]
+    assert not doc.index.find(unit="Cel", under="#/sdfProperty")
+    assert len(doc.index.find()) == len(doc.index)
+    assert set(doc.index.values("unit")) == {"Cel", "%RH", "%"}
+
+
+def test_rebuild_index():
+    doc = make_document()
+    assert not doc.index.find(unit="lx")
+
+    doc.properties["illuminance"] = sdf.NumberProperty(unit="lx")
+    del doc.index
+    assert list(doc.index.find(unit="lx")) == ["#/sdfProperty/illuminance"]
+
+
+def test_index_does_not_affect_document():
+    doc = make_document()
+    doc.index
+    assert doc == make_document()
+    assert "index" not in doc.model_dump()
@@ -0,0 +1,113 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pydantic
+import pytest
+
+from onedm import sdf
+from onedm.sdf import tracing
+from onedm.sdf.ingest import IngestPipeline, get_data_definition, validate_batch
+from onedm.sdf.metrics import ValidationMetrics
+
+DOCUMENT = sdf.Document.model_validate(
+    {
+        "sdfObject": {
+            "Sensor": {
+                "sdfProperty": {
+                    "temperature": {"type": "number", "minimum": -50, "maximum": 50},
+                },
+                "sdfEvent": {
+                    "alarm": {"sdfOutputData": {"type": "string", "maxLength": 5}},
+                },
+            }
+        }
+    }
+)
+TEMPERATURE = "#/sdfObject/Sensor/sdfProperty/temperature"
+ALARM = "#/sdfObject/Sensor/sdfEvent/alarm"
+
+
+def run_pipeline(messages, **kwargs):
+    async def main():
+        pipeline = IngestPipeline(DOCUMENT, **kwargs)
+
+        async def produce():
+            for pointer, payload in messages:
+                await pipeline.put(pointer, payload)
+            await pipeline.close()
+
+        producer = asyncio.create_task(produce())
+        results = [result async for result in pipeline]
+        await producer
+        return results
+
+    return asyncio.run(main())
+
+
+def test_results_in_order():
+    messages = [(TEMPERATURE, i % 60) for i in range(200)]
+    messages.insert(50, (ALARM, "fire"))
+    messages.insert(100, (ALARM, "too long"))
+    messages.insert(150, ("#/sdfObject/Unknown", 1))
+
+    with ThreadPoolExecutor(2) as executor:
+        results = run_pipeline(
+            messages, batch_size=16, max_queued=8, max_windows=2, executor=executor
+        )
+
+    assert [(result.pointer, result.payload) for result in results] == messages
+    for result in results:
+        if result.pointer == TEMPERATURE and result.payload <= 50:
+            assert result.value == result.payload
+            assert result.error is None
+        elif result.pointer == TEMPERATURE:
+            assert isinstance(result.error, pydantic.ValidationError)
+    assert results[50].value == "fire"
+    assert isinstance(results[100].error, pydantic.ValidationError)
+    assert isinstance(results[150].error, KeyError)
+
+
+def test_empty():
+    assert run_pipeline([]) == []
+
+
+def test_backpressure():
+    async def main():
+        pipeline = IngestPipeline(DOCUMENT, batch_size=1, max_queued=2, max_windows=1)
+        accepted = 0
+        try:
+            for _ in range(10):
+                await asyncio.wait_for(pipeline.put(TEMPERATURE, 1), 0.05)
+                accepted += 1
+        except asyncio.TimeoutError:
+            pass
+        return accepted
+
+    # One window waiting, one being collected, and two queued messages
+    assert asyncio.run(main()) == 4
+
+
+def test_process_pool_not_supported():
+    with ProcessPoolExecutor(1) as executor:
+        with pytest.raises(TypeError):
+            IngestPipeline(DOCUMENT, executor=executor)
+
+
+def test_batch_metrics():
+    metrics = ValidationMetrics(DOCUMENT)
+    recorder = tracing.RecordingTracer()
+
+    with tracing.use_tracer(metrics):
+        run_pipeline([(TEMPERATURE, 20), (TEMPERATURE, 60), (ALARM, "fire")])
+    with tracing.use_tracer(recorder):
+        validate_batch(get_data_definition(DOCUMENT, TEMPERATURE), [1, 2, 100])
+
+    assert metrics[TEMPERATURE].calls == 2
+    assert metrics[TEMPERATURE].failed_calls == 1
+    assert metrics[TEMPERATURE].failures == {"less_than_equal": 1}
+    assert sum(metrics[TEMPERATURE].histogram) == 2
+    assert metrics[ALARM + "/sdfOutputData"].calls == 1
+    (span,) = recorder.spans
+    assert span.name == "sdf.validate_batch"
+    assert span.attributes["size"] == 3
+    assert len(span.attributes["errors"]) == 1
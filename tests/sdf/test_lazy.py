@@ -0,0 +1,113 @@
+import copy
+import json
+from pathlib import Path
+import pickle
+
+import pytest
+
+from onedm import sdf
+from onedm.sdf.lazy import LazyDict
+
+
+@pytest.fixture
+def raw_document() -> dict:
+    loader = sdf.SDFLoader()
+    loader.load_file(Path(__file__).parent / "test.sdf.json")
+    return sdf.Resolver(loader.root, loader.registry).resolve(loader.root)
+
+
+def test_lazy_document(raw_document: dict):
+    doc = sdf.Document.model_validate_lazy(raw_document)
+
+    assert isinstance(doc.data, LazyDict)
+    assert doc.data.pending == len(raw_document["sdfData"])
+
+    integer = doc.data["Integer"]
+    assert isinstance(integer, sdf.IntegerData)
+    assert doc.data["Integer"] is integer
+    assert doc.data.pending == len(raw_document["sdfData"]) - 1
+
+    test_object = doc.objects["TestObject"]
+    assert isinstance(test_object.properties, LazyDict)
+    assert isinstance(test_object.properties["TestProperty"], sdf.BooleanProperty)
+    assert set(test_object.actions) == {"on", "off", "toggle"}
+
+
+def test_lazy_equals_eager(raw_document: dict):
+    lazy = sdf.Document.model_validate_lazy(raw_document)
+    eager = sdf.Document.model_validate(raw_document)
+
+    assert dict(lazy.properties.items()) == eager.properties
+    assert list(lazy.data.values()) == list(eager.data.values())
+    assert lazy == eager
+    assert lazy.to_json() == eager.to_json()
+
+
+def test_lazy_validation_error(raw_document: dict):
+    raw_document["sdfData"]["Integer"]["minimum"] = "not a number"
+
+    doc = sdf.Document.model_validate_lazy(raw_document)
+    with pytest.raises(ValueError):
+        doc.data["Integer"]
+
+
+def test_lazy_copy_and_pickle(raw_document: dict):
+    doc = sdf.Document.model_validate_lazy(raw_document)
+
+    doc.data["Integer"]
+    pending = doc.data.pending
+
+    for other in [copy.deepcopy(doc), pickle.loads(pickle.dumps(doc))]:
+        assert isinstance(other.data, LazyDict)
+        assert other.data.pending == pending
+        assert isinstance(other.data["Integer"], sdf.IntegerData)
+    assert doc.data.pending == pending
+    assert other == doc
+
+
+def test_lazy_loader():
+    loader = sdf.SDFLoader(lazy=True)
+    loader.load_bytes(json.dumps({"sdfData": {"Integer": {"type": "integer"}}}))
+    doc = loader.to_sdf()
+
+    assert isinstance(doc.data, LazyDict)
+    assert isinstance(doc.data["Integer"], sdf.IntegerData)
+
+
+def test_lazy_loader_cache(tmp_path: Path):
+    cache = sdf.cache.DocumentCache(tmp_path)
+    raw = json.dumps({"sdfData": {"Integer": {"type": "integer"}}})
+
+    for _ in range(2):
+        loader = sdf.SDFLoader(lazy=True, cache=cache)
+        loader.load_bytes(raw)
+        assert loader.to_sdf().data.pending == 1
+
+        loader = sdf.SDFLoader(cache=cache)
+        loader.load_bytes(raw)
+        assert type(loader.to_sdf().data) is dict
+
+
+def test_lazy_dict_conversion(raw_document: dict):
+    doc = sdf.Document.model_validate_lazy(raw_document)
+
+    for other in [dict(doc.data), {**doc.data}, {} | doc.data]:
+        assert isinstance(other["Integer"], sdf.IntegerData)
+    merged: dict = {}
+    merged.update(doc.data)
+    assert isinstance(merged["Integer"], sdf.IntegerData)
+
+
+def test_lazy_dump_does_not_change_model(raw_document: dict):
+    doc = sdf.Document.model_validate_lazy(raw_document)
+
+    dumped = doc.model_dump(by_alias=True)
+
+    assert dumped["sdfData"]["Integer"]["type"] == "integer"
+    assert isinstance(doc.data, LazyDict)
+    assert isinstance(doc.objects["TestObject"].properties, LazyDict)
+
+
+@pytest.mark.parametrize("model", [sdf.Document, sdf.Thing, sdf.Object])
+def test_lazy_serialization_schema(model):
+    assert model.model_json_schema(mode="serialization") == model.model_json_schema()
@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from onedm import sdf
+from onedm.sdf.loader import get_json_backend
+
+
+DOCUMENT = {
+    "info": {"title": "No references", "modified": "2024-01-01T00:00:00Z"},
+    "sdfObject": {
+        "Switch": {
+            "sdfProperty": {
+                "state": {"type": "boolean", "const": None},
+                "level": {"type": "integer", "minimum": 0, "maximum": 100},
+            },
+            "sdfRequired": ["#/sdfObject/Switch/sdfProperty/state"],
+        }
+    },
+}
+
+
+def test_load_bytes_without_references():
+    loader = sdf.SDFLoader()
+    loader.load_bytes(json.dumps(DOCUMENT).encode("utf-8"))
+    fast = loader.to_sdf()
+
+    loader = sdf.SDFLoader()
+    loader.load_from_dict(DOCUMENT)
+    slow = loader.to_sdf()
+
+    assert fast == slow
+    assert "const" in fast.objects["Switch"].properties["state"].model_fields_set
+
+
+def test_load_bytes_with_references():
+    path = Path(__file__).parent / "test.sdf.json"
+    loader = sdf.SDFLoader()
+    loader.load_bytes(path.read_bytes())
+    assert loader.root["info"]["version"] == "2019-04-24"
+
+    doc = loader.to_sdf()
+    assert doc.data["Reference"].maximum == 3
+
+
+@pytest.mark.parametrize("backend", ["json", "auto"])
+def test_json_backend(backend: str):
+    loader = sdf.SDFLoader(json_backend=backend)
+    loader.load_file(Path(__file__).parent / "test.sdf.json")
+    assert loader.to_sdf().data["Reference"].maximum == 3
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+def test_optional_json_backend(backend: str):
+    pytest.importorskip(backend)
+    assert get_json_backend(backend)(b'{"sdfRef": "#/sdfData/Integer"}') == {
+        "sdfRef": "#/sdfData/Integer"
+    }
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError):
+        get_json_backend("unknown")
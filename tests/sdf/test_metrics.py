@@ -0,0 +1,80 @@
+import io
+import json
+
+import pydantic
+import pytest
+
+from onedm import sdf
+from onedm.sdf import tracing
+from onedm.sdf.metrics import UNNAMED, ValidationMetrics
+
+
+def test_validation_metrics():
+    document = sdf.Document.model_validate(
+        {
+            "sdfObject": {
+                "Switch": {
+                    "sdfProperty": {
+                        "level": {"type": "integer", "minimum": 0, "maximum": 100},
+                    },
+                    "sdfAction": {
+                        "set": {"sdfInputData": {"type": "boolean"}},
+                    },
+                }
+            }
+        }
+    )
+    level = document.objects["Switch"].properties["level"]
+    metrics = ValidationMetrics(document, buckets=[1e-3, 1])
+
+    with tracing.use_tracer(metrics):
+        level.validate_input(50)
+        for value in (-1, 101, 200):
+            with pytest.raises(pydantic.ValidationError):
+                level.validate_input(value)
+        document.objects["Switch"].actions["set"].input_data.validate_input(True)
+        sdf.IntegerData().validate_input(1)
+    level.validate_input(1)
+
+    level_metrics = metrics["#/sdfObject/Switch/sdfProperty/level"]
+    assert level_metrics.calls == 4
+    assert level_metrics.failed_calls == 3
+    assert level_metrics.failures == {"greater_than_equal": 1, "less_than_equal": 2}
+    assert sum(level_metrics.histogram) == 4
+    assert len(level_metrics.histogram) == 3
+    assert level_metrics.total_time > 0
+    assert metrics["#/sdfObject/Switch/sdfAction/set/sdfInputData"].calls == 1
+    assert metrics[UNNAMED].calls == 1
+
+    fp = io.StringIO()
+    metrics.dump(fp)
+    dumped = json.loads(fp.getvalue())
+    assert dumped["buckets"] == [1e-3, 1]
+    assert dumped["definitions"]["#/sdfObject/Switch/sdfProperty/level"][
+        "failures"
+    ] == {
+        "greater_than_equal": 1,
+        "less_than_equal": 2,
+    }
+
+    metrics.reset()
+    assert UNNAMED not in metrics
+
+
+def test_metrics_with_other_tracer():
+    definition = sdf.IntegerData(maximum=10)
+    metrics = ValidationMetrics()
+    metrics.add_definition("level", definition)
+    recorder = tracing.RecordingTracer()
+
+    with tracing.use_tracer(tracing.MultiTracer(recorder, metrics)):
+        definition.validate_input(1)
+        with pytest.raises(pydantic.ValidationError):
+            definition.validate_input(11)
+        tracing.count("sdf.registry_lookups", ns="example", hit=True)
+
+    assert metrics["level"].calls == 2
+    assert metrics["level"].failed_calls == 1
+    assert [span.name for span in recorder.spans] == ["sdf.validate_value"] * 2
+    assert isinstance(recorder.spans[1].error, pydantic.ValidationError)
+    assert recorder.counters == {"sdf.registry_lookups": 1}
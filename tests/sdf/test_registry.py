@@ -0,0 +1,236 @@
+import json
+from pathlib import Path
+from typing import Callable
+import zipfile
+
+import pytest
+
+from onedm import sdf
+from onedm.sdf.exceptions import DocumentNotFoundError
+from onedm.sdf.registry import (
+    CombinedRegistry,
+    FileBasedRegistry,
+    InMemoryRegistry,
+    NullRegistry,
+    Registry,
+    SQLiteRegistry,
+    ZipRegistry,
+    version_key,
+)
+
+
+def test_sqlite_registry_documents(make_model):
+    registry = SQLiteRegistry()
+    registry.add_document(make_model("2020-01-01", 1))
+    registry.add_document(make_model("2022-01-01", 3))
+    registry.add_document(make_model("2021-01-01", 2))
+
+    documents = list(registry.get_documents("https://example.com/example"))
+    assert [doc["info"]["version"] for doc in documents] == [
+        "2022-01-01",
+        "2021-01-01",
+        "2020-01-01",
+    ]
+    assert not list(registry.get_documents("https://example.com/other"))
+
+
+def test_sqlite_registry_fragments(make_model):
+    registry = SQLiteRegistry()
+    registry.add_document(make_model("2020-01-01", 1))
+    registry.add_document(make_model("2022-01-01", 3))
+
+    fragment = next(
+        iter(
+            registry.get_fragments(
+                "https://example.com/example", "#/sdfObject/Example/sdfProperty/Level"
+            )
+        )
+    )
+    assert fragment.definition == {"sdfRef": "#/sdfData/Level"}
+    assert fragment.load_document()["info"]["version"] == "2022-01-01"
+
+    # Not a named definition, so found by walking the documents
+    fragment = next(
+        iter(
+            registry.get_fragments(
+                "https://example.com/example", "#/sdfData/Level/maximum"
+            )
+        )
+    )
+    assert fragment.definition == 3
+
+
+def test_sqlite_registry_resolve(make_model):
+    top_level_doc = {
+        "namespace": {"example": "https://example.com/example"},
+        "sdfProperty": {
+            "Level": {"sdfRef": "example:#/sdfObject/Example/sdfProperty/Level"}
+        },
+    }
+
+    registry = SQLiteRegistry()
+    registry.add_document(make_model("2020-01-01", 1))
+    registry.add_document(make_model("2022-01-01", 3))
+
+    resolver = sdf.Resolver(top_level_doc, registry)
+    doc = sdf.Document.model_validate(resolver.resolve(top_level_doc))
+    assert doc.properties["Level"].maximum == 3
+
+
+def test_sqlite_registry_import_directory(tmp_path: Path, make_model):
+    for version, maximum in [("2020-01-01", 1), ("2022-01-01", 3)]:
+        path = tmp_path / f"example-{version}.sdf.json"
+        path.write_text(json.dumps(make_model(version, maximum)))
+    # Does not contribute to a namespace
+    (tmp_path / "other.sdf.json").write_text(json.dumps({"sdfData": {}}))
+
+    database = tmp_path / "models.db"
+    registry = SQLiteRegistry(database)
+    assert registry.import_directory(tmp_path) == 2
+    registry.close()
+
+    registry = SQLiteRegistry(database)
+    resolver = sdf.Resolver.from_registry(registry)
+    definition, _ = resolver.deref("https://example.com/example#/sdfData/Level")
+    assert definition["maximum"] == 3
+
+
+def make_archive(path: Path, make_model: Callable[..., dict]) -> Path:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for version, maximum in [("2022-01-01", 3), ("2020-01-01", 1)]:
+            archive.writestr(
+                f"models/example-{version}.sdf.json",
+                json.dumps(make_model(version, maximum)),
+            )
+        archive.writestr("models/other.sdf.json", json.dumps({"sdfData": {}}))
+        archive.writestr("README.md", "Not a model")
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_zip_registry(tmp_path: Path, use_mmap: bool, make_model):
+    registry = ZipRegistry(
+        make_archive(tmp_path / "models.zip", make_model), use_mmap=use_mmap
+    )
+
+    documents = list(registry.get_documents("https://example.com/example"))
+    assert [doc["info"]["version"] for doc in documents] == [
+        "2022-01-01",
+        "2020-01-01",
+    ]
+    assert not list(registry.get_documents("https://example.com/other"))
+
+    resolver = sdf.Resolver.from_registry(registry)
+    definition, _ = resolver.deref("https://example.com/example#/sdfData/Level")
+    assert definition["maximum"] == 3
+    registry.close()
+
+
+def test_zip_registry_cache(tmp_path: Path, make_model):
+    registry = ZipRegistry(
+        make_archive(tmp_path / "models.zip", make_model), cache_size=1
+    )
+
+    first = next(iter(registry.get_documents("https://example.com/example")))
+    second = next(iter(registry.get_documents("https://example.com/example")))
+    assert first is second
+    registry.close()
+
+
+class CountingRegistry(InMemoryRegistry):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaded = 0
+
+    def get_documents(self, ns):
+        for model in super().get_documents(ns):
+            self.loaded += 1
+            yield model
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_combined_registry(cache: bool, make_model):
+    first = CountingRegistry()
+    first.add_document(make_model("2020-01-01", 1))
+    first.add_document(make_model("2023-01-01", 4))
+    second = CountingRegistry()
+    second.add_document(make_model("2021-01-01", 2))
+    second.add_document(make_model("2022-01-01", 3))
+
+    registry = CombinedRegistry([first, second], cache=cache)
+
+    documents = iter(registry.get_documents("https://example.com/example"))
+    assert next(documents)["info"]["version"] == "2023-01-01"
+    # Only the newest document of each registry needed to be loaded
+    assert first.loaded + second.loaded == 2
+
+    documents = registry.get_documents("https://example.com/example")
+    assert [doc["info"]["version"] for doc in documents] == [
+        "2023-01-01",
+        "2022-01-01",
+        "2021-01-01",
+        "2020-01-01",
+    ]
+    if cache:
+        assert first.loaded + second.loaded == 4
+        assert len(list(registry.get_documents("https://example.com/example"))) == 4
+        assert first.loaded + second.loaded == 4
+
+
+def test_version_key():
+    assert version_key("9") < version_key("10")
+    assert version_key("1.2") < version_key("1.10")
+    assert version_key("1.0") < version_key("1.0.1")
+    assert version_key("2019-04-24") < version_key("2019-12-01")
+    assert version_key("") < version_key("1")
+
+
+def make_registries(
+    tmp_path: Path, versions: list[str], make_model: Callable[..., dict]
+) -> list[Registry]:
+    in_memory = InMemoryRegistry()
+    sqlite = SQLiteRegistry()
+    for i, version in enumerate(versions):
+        model = make_model(version, i)
+        in_memory.add_document(model)
+        sqlite.add_document(model)
+        path = tmp_path / f"example-{version}.sdf.json"
+        path.write_text(json.dumps(model))
+
+    with zipfile.ZipFile(tmp_path / "models.zip", "w") as archive:
+        for path in tmp_path.glob("*.sdf.json"):
+            archive.write(path, path.name)
+
+    return [
+        in_memory,
+        FileBasedRegistry(tmp_path),
+        ZipRegistry(tmp_path / "models.zip"),
+        sqlite,
+        CombinedRegistry([in_memory, NullRegistry()]),
+    ]
+
+
+def test_version_lookup(tmp_path: Path, make_model):
+    for registry in make_registries(tmp_path, ["9", "10", "1.2", "1.10"], make_model):
+        documents = registry.get_documents("https://example.com/example")
+        assert [doc["info"]["version"] for doc in documents] == [
+            "10",
+            "9",
+            "1.10",
+            "1.2",
+        ]
+        assert (
+            registry.get_latest("https://example.com/example")["info"]["version"]
+            == "10"
+        )
+        assert (
+            registry.get_document("https://example.com/example", "1.10")["sdfData"][
+                "Level"
+            ]["maximum"]
+            == 3
+        )
+
+        with pytest.raises(DocumentNotFoundError):
+            registry.get_document("https://example.com/example", "1.3")
+        with pytest.raises(DocumentNotFoundError):
+            registry.get_latest("https://example.com/other")
@@ -138,3 +138,52 @@ def test_unresolvable_reference():
     doc = sdf.Document.model_validate(resolved)
 
     assert doc.data["Example3"].ref == "example:#/sdfData/Example"
+    assert resolver.unresolved == [
+        ("#/sdfData/Example3", "example:#/sdfData/Example"),
+    ]
+
+
+def test_unresolved_references_in_referenced_definition():
+    top_level_doc = {
+        "namespace": {
+            "example": "https://example.com/example",
+            "missing": "https://example.com/missing",
+        },
+        "sdfObject": {
+            "Object": {
+                "sdfProperty": {
+                    "copy": {"sdfRef": "example:#/sdfData/Example"},
+                    "missing": {"sdfRef": "missing:#/sdfData/Missing"},
+                },
+            }
+        },
+    }
+    example = {
+        "namespace": {
+            "example": "https://example.com/example",
+            "missing": "https://example.com/missing",
+        },
+        "defaultNamespace": "example",
+        "sdfData": {
+            "Example": {
+                "type": "object",
+                "properties": {"nested": {"sdfRef": "missing:#/sdfData/Nested"}},
+            }
+        },
+    }
+    registry = onedm.sdf.registry.InMemoryRegistry()
+    registry.add_document(example)
+
+    resolver = sdf.Resolver(top_level_doc, registry)
+    resolver.resolve(top_level_doc)
+
+    assert resolver.unresolved == [
+        (
+            "#/sdfObject/Object/sdfProperty/copy/properties/nested",
+            "missing:#/sdfData/Nested",
+        ),
+        (
+            "#/sdfObject/Object/sdfProperty/missing",
+            "missing:#/sdfData/Missing",
+        ),
+    ]
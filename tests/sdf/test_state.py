@@ -0,0 +1,141 @@
+import enum
+
+import pydantic
+import pytest
+
+from onedm import sdf
+from onedm.sdf.exceptions import PropertyAccessError
+from onedm.sdf.state import StateStore
+
+
+@pytest.fixture
+def store() -> StateStore:
+    thing = sdf.Thing.model_validate(
+        {
+            "sdfObject": {
+                "Light": {
+                    "sdfProperty": {
+                        "on": {"type": "boolean"},
+                        "level": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "maximum": 100,
+                            "default": 100,
+                        },
+                        "mode": {
+                            "type": "integer",
+                            "sdfChoice": {"OFF": {"const": 0}, "ON": {"const": 1}},
+                            "observable": False,
+                        },
+                        "power": {"type": "number", "writable": False},
+                        "secret": {"type": "string", "readable": False},
+                    }
+                }
+            }
+        }
+    )
+    return StateStore(thing)
+
+
+def test_read_and_write(store: StateStore):
+    store.add_instance("lamp1")
+    store.add_instance("lamp2", {"#/sdfObject/Light/sdfProperty/on": True})
+
+    assert len(store) == 2
+    assert store.read("lamp1", "#/sdfObject/Light/sdfProperty/on") is None
+    assert store.read("lamp1", "#/sdfObject/Light/sdfProperty/level") == 100
+    assert store.read("lamp2", "#/sdfObject/Light/sdfProperty/on") is True
+
+    assert store.write("lamp1", "#/sdfObject/Light/sdfProperty/level", "50")
+    assert store.read("lamp1", "#/sdfObject/Light/sdfProperty/level") == 50
+    assert not store.write("lamp1", "#/sdfObject/Light/sdfProperty/level", 50)
+
+    store.write("lamp1", "#/sdfObject/Light/sdfProperty/mode", 1)
+    mode = store.read("lamp1", "#/sdfObject/Light/sdfProperty/mode")
+    assert isinstance(mode, enum.IntEnum) and mode.name == "ON"
+
+    with pytest.raises(pydantic.ValidationError):
+        store.write("lamp1", "#/sdfObject/Light/sdfProperty/level", 101)
+    with pytest.raises(KeyError):
+        store.write("lamp1", "#/sdfObject/Light/sdfProperty/unknown", 1)
+    with pytest.raises(KeyError):
+        store.write("lamp3", "#/sdfObject/Light/sdfProperty/on", True)
+
+    store.remove_instance("lamp2")
+    assert "lamp2" not in store
+
+
+def test_access(store: StateStore):
+    store.add_instance("lamp")
+
+    with pytest.raises(PropertyAccessError):
+        store.write("lamp", "#/sdfObject/Light/sdfProperty/power", 1.5)
+    store.write(
+        "lamp", "#/sdfObject/Light/sdfProperty/power", 1.5, check_writable=False
+    )
+    store.write("lamp", "#/sdfObject/Light/sdfProperty/secret", "abc")
+
+    with pytest.raises(PropertyAccessError):
+        store.read("lamp", "#/sdfObject/Light/sdfProperty/secret")
+    assert store.snapshot("lamp") == {
+        "#/sdfObject/Light/sdfProperty/level": 100,
+        "#/sdfObject/Light/sdfProperty/power": 1.5,
+    }
+
+
+def test_update_notifications(store: StateStore):
+    store.add_instance("lamp")
+    changes = []
+    unsubscribe = store.subscribe(lambda *change: changes.append(change))
+
+    changed = store.update(
+        "lamp",
+        {
+            "#/sdfObject/Light/sdfProperty/on": True,
+            "#/sdfObject/Light/sdfProperty/level": 100,
+            "#/sdfObject/Light/sdfProperty/mode": 1,
+        },
+    )
+
+    assert changed == {
+        "#/sdfObject/Light/sdfProperty/on": True,
+        "#/sdfObject/Light/sdfProperty/mode": 1,
+    }
+    # Mode is not observable and level did not change
+    assert changes == [("lamp", "#/sdfObject/Light/sdfProperty/on", None, True)]
+
+    # Nothing is written if any value is invalid
+    with pytest.raises(pydantic.ValidationError):
+        store.update(
+            "lamp",
+            {
+                "#/sdfObject/Light/sdfProperty/on": False,
+                "#/sdfObject/Light/sdfProperty/level": -1,
+            },
+        )
+    assert store.read("lamp", "#/sdfObject/Light/sdfProperty/on") is True
+
+    unsubscribe()
+    store.write("lamp", "#/sdfObject/Light/sdfProperty/on", False)
+    assert len(changes) == 1
+
+
+def test_failing_subscriber(store: StateStore):
+    store.add_instance("lamp")
+
+    def fail(*change):
+        raise RuntimeError("Subscriber failed")
+
+    store.subscribe(fail)
+    with pytest.raises(RuntimeError):
+        store.update(
+            "lamp",
+            {
+                "#/sdfObject/Light/sdfProperty/on": True,
+                "#/sdfObject/Light/sdfProperty/level": 50,
+            },
+        )
+
+    # All values were written before notifying
+    assert store.read("lamp", "#/sdfObject/Light/sdfProperty/on") is True
+    assert store.read("lamp", "#/sdfObject/Light/sdfProperty/level") == 50
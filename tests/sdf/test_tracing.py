@@ -0,0 +1,70 @@
+import pydantic
+import pytest
+
+from onedm import sdf
+from onedm.sdf import registry, tracing
+
+
+def test_tracing_disabled():
+    assert tracing.get_tracer() is None
+    with tracing.span("test", value=1) as span:
+        span.set("other", 2)
+    tracing.count("test")
+
+
+def test_load_and_validate():
+    models = registry.InMemoryRegistry()
+    models.add_document(
+        {
+            "namespace": {"example": "https://example.com/example"},
+            "defaultNamespace": "example",
+            "sdfData": {"Level": {"type": "integer", "maximum": 100}},
+        }
+    )
+    loader = sdf.SDFLoader(models)
+    loader.load_bytes(
+        b"""{
+            "namespace": {
+                "example": "https://example.com/example",
+                "missing": "https://example.com/missing"
+            },
+            "sdfData": {
+                "Level": {"sdfRef": "example:#/sdfData/Level", "minimum": 0},
+                "Missing": {"sdfRef": "missing:#/sdfData/Missing"}
+            }
+        }"""
+    )
+    tracer = tracing.RecordingTracer()
+
+    with tracing.use_tracer(tracer):
+        document = loader.to_sdf()
+        document.data["Level"].validate_input(50)
+        with pytest.raises(pydantic.ValidationError):
+            document.data["Level"].validate_input(101)
+    document.data["Level"].validate_input(50)
+
+    assert tracing.get_tracer() is None
+    assert [span.name for span in tracer.spans] == [
+        "sdf.parse",
+        "sdf.deref",
+        "sdf.merge",
+        "sdf.deref",
+        "sdf.validate_model",
+        "sdf.validate_value",
+        "sdf.validate_value",
+    ]
+    parse, deref, merge, missing, _, valid, invalid = tracer.spans
+    assert parse.attributes["size"] > 0
+    assert deref.attributes == {
+        "ns": "https://example.com/example",
+        "path": "#/sdfData/Level",
+        "hit": True,
+    }
+    assert merge.attributes == {"pointer": "#/sdfData/Level"}
+    assert missing.attributes["hit"] is False
+    assert missing.error is not None
+    assert valid.attributes == {"type": "integer", "definition": document.data["Level"]}
+    assert valid.error is None
+    assert isinstance(invalid.error, pydantic.ValidationError)
+    assert all(span.duration >= 0 for span in tracer.spans)
+    assert tracer.counters == {"sdf.registry_lookups": 2}
@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+
+from onedm.sdf import registry
+from onedm.sdf.validate import find_files, main, validate_files
+
+TEST_MODEL = Path(__file__).parent / "test.sdf.json"
+
+
+def write_models(directory: Path) -> None:
+    (directory / "sub").mkdir()
+    (directory / "valid.sdf.json").write_text(
+        json.dumps({"sdfData": {"Level": {"type": "integer"}}})
+    )
+    (directory / "sub" / "invalid.sdf.json").write_text(
+        json.dumps({"sdfData": {"Level": {"type": "integer", "maximum": "high"}}})
+    )
+    (directory / "sub" / "broken.sdf.json").write_text("{")
+    (directory / "other.json").write_text("{}")
+
+
+def test_find_files(tmp_path: Path):
+    write_models(tmp_path)
+
+    assert find_files([str(tmp_path)]) == [
+        tmp_path / "sub" / "broken.sdf.json",
+        tmp_path / "sub" / "invalid.sdf.json",
+        tmp_path / "valid.sdf.json",
+    ]
+    assert find_files([str(tmp_path / "*.json"), str(tmp_path / "valid.sdf.json")]) == [
+        tmp_path / "other.json",
+        tmp_path / "valid.sdf.json",
+    ]
+
+
+def test_validate_files_in_parallel(tmp_path: Path):
+    write_models(tmp_path)
+    paths = find_files([str(tmp_path)]) * 3
+
+    results = list(validate_files(paths, registry.NullRegistry(), jobs=2))
+
+    assert [result.path for result in results] == paths
+    assert [result.valid for result in results] == [False, False, True] * 3
+    assert results[0].errors[0]["type"] == "JSONDecodeError"
+    assert any(e["loc"].endswith("integer.maximum") for e in results[1].errors)
+
+
+def test_unexpected_errors_do_not_stop_batch(tmp_path: Path):
+    (tmp_path / "array.sdf.json").write_text("[1, 2]")
+    (tmp_path / "scalar.sdf.json").write_text(
+        json.dumps(
+            {
+                "info": {"title": "Scalar"},
+                "sdfData": {"Level": {"sdfRef": "#/info/title/x"}},
+            }
+        )
+    )
+    (tmp_path / "local.sdf.json").write_text(
+        json.dumps({"sdfData": {"Level": {"sdfRef": "#/sdfData/Missing"}}})
+    )
+    (tmp_path / "valid.sdf.json").write_text(
+        json.dumps({"sdfData": {"Level": {"type": "integer"}}})
+    )
+    paths = find_files([str(tmp_path)])
+
+    for jobs in (1, 2):
+        results = list(validate_files(paths, registry.NullRegistry(), jobs=jobs))
+
+        assert [result.valid for result in results] == [False, False, False, True]
+        assert all(len(result.errors) == 1 for result in results[:3])
+
+
+def test_report(tmp_path: Path):
+    write_models(tmp_path)
+    report_path = tmp_path / "report.json"
+
+    assert main([str(TEST_MODEL), "--report", str(report_path)]) == 0
+    assert main([str(tmp_path), "--report", str(report_path)]) == 1
+
+    report = json.loads(report_path.read_text())
+    assert report["valid"] == 1
+    assert report["invalid"] == 2
+    assert report["files"][2]["path"] == str(tmp_path / "valid.sdf.json")
+    assert report["files"][2]["errors"] == []
+    assert report["files"][2]["time"] > 0
+
+
+def test_check_refs(tmp_path: Path):
+    path = tmp_path / "refs.sdf.json"
+    path.write_text(
+        json.dumps(
+            {
+                "namespace": {"missing": "https://example.com/missing"},
+                "sdfData": {
+                    "First": {"sdfRef": "missing:#/sdfData/First"},
+                    "Second": {"sdfRef": "missing:#/sdfData/Second"},
+                },
+            }
+        )
+    )
+
+    (result,) = validate_files([path], registry.NullRegistry(), check_refs=True)
+
+    assert [error["loc"] for error in result.errors] == [
+        "#/sdfData/First",
+        "#/sdfData/Second",
+    ]
@@ -1,5 +1,6 @@
 import enum
 import pytest
+from pydantic import ValidationError
 from onedm import sdf
 
 
@@ -77,3 +78,82 @@ def test_non_nullable_validation():
     integer = sdf.IntegerData(nullable=False)
     with pytest.raises(ValueError):
         integer.validate_input(None)
+
+
+def test_object_patch():
+    data = sdf.ObjectData(
+        properties={
+            "name": sdf.StringData(),
+            "count": sdf.IntegerData(minimum=0),
+            "position": sdf.ObjectData(
+                properties={"x": sdf.NumberData(), "y": sdf.NumberData()},
+                required=["x", "y"],
+            ),
+            "tags": sdf.ArrayData(items=sdf.StringData()),
+        },
+        required=["name"],
+    )
+    current = data.validate_input(
+        {"name": "a", "count": 1, "position": {"x": 1, "y": 2}, "tags": ["t"]}
+    )
+
+    patched = data.validate_patch(
+        current, {"count": "2", "position": {"y": 3}, "tags": None, "unknown": 1}
+    )
+
+    assert patched == {"name": "a", "count": 2, "position": {"x": 1, "y": 3}}
+    assert current["count"] == 1
+    assert patched == data.validate_input(patched)
+
+    validate_patch = data.get_patch_validator()
+    for count in range(3):
+        patched = validate_patch(patched, {"count": count, "position": {"x": count}})
+    assert patched == {"name": "a", "count": 2, "position": {"x": 2, "y": 3}}
+    with pytest.raises(ValidationError):
+        validate_patch(patched, {"count": -1})
+
+
+def test_object_patch_errors():
+    data = sdf.ObjectData(
+        properties={
+            "name": sdf.StringData(),
+            "count": sdf.IntegerData(minimum=0),
+            "position": sdf.ObjectData(
+                properties={"x": sdf.NumberData(), "y": sdf.NumberData()},
+                required=["x", "y"],
+            ),
+        },
+        required=["name"],
+    )
+    current = {"name": "a", "count": 1}
+
+    with pytest.raises(ValidationError) as exc_info:
+        data.validate_patch(current, {"name": None, "count": -1, "position": {"x": 1}})
+
+    assert [(error["type"], error["loc"]) for error in exc_info.value.errors()] == [
+        ("missing", ("name",)),
+        ("greater_than_equal", ("count",)),
+        ("missing", ("position", "y")),
+    ]
+
+
+def test_object_patch_const_and_choices():
+    data = sdf.ObjectData(
+        properties={
+            "pos": sdf.ObjectData(
+                properties={"x": sdf.NumberData(), "y": sdf.NumberData()},
+                const={"x": 1, "y": 2},
+            ),
+        },
+    )
+    current = {"pos": {"x": 1, "y": 2}}
+
+    assert data.validate_patch(current, {"pos": {"x": 1}}) == current
+    with pytest.raises(ValidationError) as exc_info:
+        data.validate_patch(current, {"pos": {"x": 5}})
+    assert exc_info.value.errors()[0]["loc"][0] == "pos"
+    with pytest.raises(ValidationError):
+        data.validate_input({"pos": {"x": 5, "y": 2}})
+
+    with pytest.raises(ValidationError):
+        data.properties["pos"].validate_patch({"x": 1, "y": 2}, {"y": 3})